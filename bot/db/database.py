@@ -5,15 +5,17 @@ Handles PostgreSQL connections, sessions, and initialization.
 """
 
 from contextlib import asynccontextmanager
-from typing import AsyncGenerator
+from contextvars import ContextVar
+from typing import AsyncGenerator, Optional
 
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import (
     create_async_engine,
     AsyncSession,
     async_sessionmaker,
 )
 
-from bot.db.models import Base
+from bot.db.models import Base, EMBED_DIM
 from bot.utils.config import settings
 from bot.utils.logger import get_logger
 
@@ -24,8 +26,20 @@ engine = create_async_engine(
     settings.DATABASE_URL,
     echo=settings.LOG_LEVEL == "DEBUG",
     pool_pre_ping=True,
-    pool_size=10,
-    max_overflow=20,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_recycle=1800,
+    # SQLAlchemy compiled-SQL cache: per-message statements compile once
+    query_cache_size=2048,
+    connect_args={
+        # asyncpg statement caches: repeated queries skip parse/plan
+        "statement_cache_size": 2048,
+        "prepared_statement_cache_size": 2048,
+        # All queries here are short single-row statements; Postgres JIT
+        # compilation only adds latency for this workload
+        "server_settings": {"jit": "off"},
+    },
 )
 
 AsyncSessionLocal = async_sessionmaker(
@@ -35,16 +49,46 @@ AsyncSessionLocal = async_sessionmaker(
 )
 
 
+# Session active in the current task, if any. Lets nested
+# get_db_session() calls inside one logical operation share a session
+# (one pool checkout, one commit) instead of opening their own.
+#
+# Caveat: asyncio tasks snapshot the context at creation, and that
+# snapshot INCLUDES the current value - a task spawned inside an open
+# get_db_session() scope inherits the open session and would use it
+# concurrently with its parent (AsyncSession is not safe for that;
+# asyncpg raises "another operation is in progress"). Only spawn
+# session-opening tasks from outside any session scope.
+_current_session: ContextVar[Optional[AsyncSession]] = ContextVar(
+    "_current_session", default=None
+)
+
+
 @asynccontextmanager
 async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
     """
     Get a database session (auto-commits on success, auto-rollbacks on error)
 
+    Nested calls within the same task reuse the enclosing session; the
+    outermost context owns commit/rollback/close.
+
+    Do not create_task() work that opens its own session while inside
+    this context manager: the new task's context snapshot carries the
+    open session, so its nested get_db_session() would reuse it
+    concurrently with this scope. Spawn such tasks after the scope exits
+    (as the message handler and the background audit logger do).
+
     Usage:
         async with get_db_session() as session:
             user = await session.get(User, 1)
     """
+    existing = _current_session.get()
+    if existing is not None:
+        yield existing
+        return
+
     session = AsyncSessionLocal()
+    token = _current_session.set(session)
     try:
         yield session
         await session.commit()
@@ -53,14 +97,80 @@ async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
         logger.error(f"Database session error: {e}")
         raise
     finally:
+        _current_session.reset(token)
         await session.close()
 
 
+# Set once the DDL pass has run, so repeated init_db() calls within one
+# process (scripts, restarts of the polling loop) cost nothing
+_schema_ready = False
+
+# In-place upgrades for databases created by earlier schema versions.
+# create_all skips tables that already exist, so column-level changes
+# need their own statements; each is idempotent - guarded by a catalog
+# check or a cheap no-op on an already-current schema.
+_SCHEMA_UPGRADES = (
+    # FAQ.embedding moved from double precision[] to halfvec
+    f"""
+    DO $$
+    BEGIN
+        IF EXISTS (
+            SELECT 1 FROM information_schema.columns
+            WHERE table_name = 'faqs' AND column_name = 'embedding'
+              AND udt_name <> 'halfvec'
+        ) THEN
+            ALTER TABLE faqs
+                ALTER COLUMN embedding TYPE halfvec({EMBED_DIM})
+                USING embedding::real[]::vector::halfvec({EMBED_DIM});
+        END IF;
+    END $$
+    """,
+    # Server-side timestamp defaults replaced the client-side
+    # datetime.utcnow defaults; older tables never received them
+    "ALTER TABLE users ALTER COLUMN joined_at SET DEFAULT now()",
+    "ALTER TABLE users ALTER COLUMN last_active SET DEFAULT now()",
+    "ALTER TABLE messages ALTER COLUMN sent_at SET DEFAULT now()",
+    "ALTER TABLE faqs ALTER COLUMN created_at SET DEFAULT now()",
+    "ALTER TABLE faqs ALTER COLUMN updated_at SET DEFAULT now()",
+    "ALTER TABLE mentor_tags ALTER COLUMN tagged_at SET DEFAULT now()",
+    "ALTER TABLE moderation_logs ALTER COLUMN moderated_at SET DEFAULT now()",
+    # sent_at is NOT NULL in the model; backfill before enforcing
+    "UPDATE messages SET sent_at = now() WHERE sent_at IS NULL",
+    "ALTER TABLE messages ALTER COLUMN sent_at SET NOT NULL",
+)
+
+
 async def init_db():
-    """Create all database tables if they don't exist"""
+    """Create or upgrade the database schema (idempotent)"""
+    global _schema_ready
+    if _schema_ready:
+        return
+
     async with engine.begin() as conn:
+        # pgvector extension must exist before the FAQ embedding column
+        await conn.execute(text("CREATE EXTENSION IF NOT EXISTS vector"))
         await conn.run_sync(Base.metadata.create_all)
-        logger.info("Database tables created successfully")
+
+        # create_all skips existing tables wholesale, so indexes declared
+        # after a deployment's first init need a checked pass of their own
+        def _create_missing_indexes(sync_conn):
+            for table in Base.metadata.tables.values():
+                for index in table.indexes:
+                    index.create(sync_conn, checkfirst=True)
+
+        await conn.run_sync(_create_missing_indexes)
+
+        for statement in _SCHEMA_UPGRADES:
+            await conn.execute(text(statement))
+
+        # ANN index so FAQ similarity search is an index walk, not a full
+        # scan (after the upgrades: it needs the halfvec column type)
+        await conn.execute(text(
+            "CREATE INDEX IF NOT EXISTS faq_embedding_hnsw "
+            "ON faqs USING hnsw (embedding halfvec_cosine_ops)"
+        ))
+        logger.info("Database schema created/upgraded successfully")
+    _schema_ready = True
 
 
 async def close_db():
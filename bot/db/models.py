@@ -4,7 +4,6 @@ Database Models using SQLAlchemy ORM
 Each class represents a database table.
 """
 
-from datetime import datetime
 from sqlalchemy import (
     Column,
     Integer,
@@ -15,9 +14,15 @@ from sqlalchemy import (
     ForeignKey,
     Float,
     BigInteger,
+    Index,
 )
 from sqlalchemy.orm import relationship, DeclarativeBase
+from sqlalchemy.sql import func
 from sqlalchemy.dialects.postgresql import ARRAY
+from pgvector.sqlalchemy import HALFVEC
+
+# Embedding dimension (OpenAI text-embedding-3-small)
+EMBED_DIM = 1536
 
 
 class Base(DeclarativeBase):
@@ -39,8 +44,10 @@ class User(Base):
     is_mentor = Column(Boolean, default=False)
     expertise_domains = Column(ARRAY(String), default=list)
 
-    joined_at = Column(DateTime, default=datetime.utcnow)
-    last_active = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    # Server-side timestamps: Postgres fills them in, keeping clocks
+    # consistent across app replicas and parameters off the wire
+    joined_at = Column(DateTime(timezone=True), server_default=func.now())
+    last_active = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
     messages = relationship("Message", back_populates="user", cascade="all, delete-orphan")
 
@@ -59,11 +66,20 @@ class Message(Base):
 
     is_deleted = Column(Boolean, default=False)
     deletion_reason = Column(String(255), nullable=True)
-    sent_at = Column(DateTime, default=datetime.utcnow)
+    sent_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
 
-    user = relationship("User", back_populates="messages")
+    # Almost always consumed with the message, so eager-load in one batched
+    # SELECT instead of a lazy query per row (N+1)
+    user = relationship("User", back_populates="messages", lazy="selectin")
     mentor_tags = relationship("MentorTag", back_populates="message", cascade="all, delete-orphan")
 
+    __table_args__ = (
+        # Per-user recency scans and cascade deletes from users
+        Index("ix_messages_user_sent", "user_id", "sent_at"),
+        # Lookups by Telegram message ID (deletion, audit)
+        Index("ix_messages_tg_msg_id", "telegram_message_id"),
+    )
+
     def __repr__(self):
         return f"<Message {self.id} from User {self.user_id}>"
 
@@ -76,11 +92,13 @@ class FAQ(Base):
     question = Column(Text, nullable=False)
     answer = Column(Text, nullable=False)
     category = Column(String(100), nullable=True)
-    embedding = Column(ARRAY(Float), nullable=True)
+    # FP16 storage halves index memory and bytes per distance computation;
+    # recall loss is negligible at this corpus size
+    embedding = Column(HALFVEC(EMBED_DIM), nullable=True)
 
     created_by = Column(Integer, ForeignKey("users.id"), nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
     times_matched = Column(Integer, default=0)
 
     def __repr__(self):
@@ -95,13 +113,17 @@ class MentorTag(Base):
     message_id = Column(Integer, ForeignKey("messages.id"), nullable=False)
     mentor_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     reason = Column(String(255), nullable=True)
-    tagged_at = Column(DateTime, default=datetime.utcnow)
+    tagged_at = Column(DateTime(timezone=True), server_default=func.now())
 
     responded = Column(Boolean, default=False)
     responded_at = Column(DateTime, nullable=True)
 
     message = relationship("Message", back_populates="mentor_tags")
-    mentor = relationship("User")
+    mentor = relationship("User", lazy="selectin")
+
+    __table_args__ = (
+        Index("ix_mentor_tags_message_id", "message_id"),
+    )
 
     def __repr__(self):
         return f"<MentorTag: Mentor {self.mentor_id} tagged for Message {self.message_id}>"
@@ -120,8 +142,22 @@ class ModerationLog(Base):
     confidence = Column(Float, nullable=False)
     message_text = Column(Text, nullable=True)
 
-    moderated_at = Column(DateTime, default=datetime.utcnow)
+    moderated_at = Column(DateTime(timezone=True), server_default=func.now())
     llm_provider = Column(String(50), nullable=True)
 
+    __table_args__ = (
+        # Partial index keeps the /stats deleted-message count O(index size)
+        # as the audit log grows
+        Index(
+            "ix_modlogs_action_deleted",
+            action,
+            postgresql_where=(action == "deleted")
+        ),
+        # For time-windowed stats over the log
+        Index("ix_modlogs_moderated_at", moderated_at),
+        # Per-user moderation history
+        Index("ix_modlogs_user_moderated", user_id, moderated_at),
+    )
+
     def __repr__(self):
         return f"<ModerationLog: {self.action} on Message {self.message_id}>"
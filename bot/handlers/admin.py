@@ -10,7 +10,9 @@ from telegram.ext import ContextTypes
 
 from bot.db.database import get_db_session
 from bot.db.models import User, FAQ, ModerationLog
-from bot.services.faq_service import FAQService
+from bot.handlers.message import clear_recent_faq_matches
+from bot.services.faq_service import faq_service
+from bot.services.user_cache import resolve_user_id
 from bot.utils.config import settings
 from bot.utils.logger import get_logger
 from sqlalchemy import select, func
@@ -18,9 +20,6 @@ from sqlalchemy import select, func
 logger = get_logger(__name__)
 
 
-faq_service = FAQService()
-
-
 def is_admin(user_id: int) -> bool:
     """Check if user is admin"""
     return user_id in settings.get_admin_ids()
@@ -103,12 +102,8 @@ async def cmd_add_faq(update: Update, context: ContextTypes.DEFAULT_TYPE):
         answer = parts[1]
         category = parts[2] if len(parts) > 2 else None
 
-        async with get_db_session() as session:
-            result = await session.execute(
-                select(User).where(User.telegram_id == user_id)
-            )
-            user = result.scalar_one_or_none()
-            user_db_id = user.id if user else None
+        # Cached telegram_id -> user.id mapping; DB hit only on cache miss
+        user_db_id = await resolve_user_id(user_id)
 
         faq = await faq_service.add_faq(
             question=question,
@@ -117,6 +112,10 @@ async def cmd_add_faq(update: Update, context: ContextTypes.DEFAULT_TYPE):
             created_by=user_db_id
         )
 
+        # The message handler's exact-repeat cache may hold stale matches
+        # for questions the new FAQ should now answer
+        clear_recent_faq_matches()
+
         await update.message.reply_text(
             f"✅ FAQ added successfully!\n\n"
             f"**ID:** {faq.id}\n"
@@ -141,26 +140,29 @@ async def cmd_list_faqs(update: Update, context: ContextTypes.DEFAULT_TYPE):
         return
 
     try:
-        faqs = await faq_service.get_all_faqs()
+        faqs = await faq_service.list_faqs(limit=20)
 
         if not faqs:
             await update.message.reply_text("📭 No FAQs found.")
             return
 
-        response = "📚 **All FAQs**\n\n"
+        total = await faq_service.count_faqs()
 
-        for faq in faqs[:20]:
-            response += (
+        # Build once with join instead of quadratic str += in the loop
+        parts = ["📚 **All FAQs**\n\n"]
+
+        for faq in faqs:
+            parts.append(
                 f"**ID:** {faq.id}\n"
                 f"**Q:** {faq.question[:100]}...\n"
                 f"**Category:** {faq.category or 'None'}\n"
                 f"**Matches:** {faq.times_matched}\n\n"
             )
 
-        if len(faqs) > 20:
-            response += f"\n_Showing 20 of {len(faqs)} FAQs_"
+        if total > len(faqs):
+            parts.append(f"\n_Showing {len(faqs)} of {total} FAQs_")
 
-        await update.message.reply_text(response, parse_mode="Markdown")
+        await update.message.reply_text("".join(parts), parse_mode="Markdown")
 
     except Exception as e:
         logger.error(f"Error listing FAQs: {e}", exc_info=True)
@@ -193,6 +195,9 @@ async def cmd_delete_faq(update: Update, context: ContextTypes.DEFAULT_TYPE):
         deleted = await faq_service.delete_faq(faq_id)
 
         if deleted:
+            # Without this, the exact-repeat cache keeps answering with
+            # the deleted FAQ until the process restarts
+            clear_recent_faq_matches()
             await update.message.reply_text(f"✅ FAQ {faq_id} deleted successfully.")
             logger.info(f"Admin {user_id} deleted FAQ {faq_id}")
         else:
@@ -212,16 +217,24 @@ async def cmd_stats(update: Update, context: ContextTypes.DEFAULT_TYPE):
         return
 
     try:
+        # All four counts in a single SELECT - one round-trip instead of four
+        stats_stmt = select(
+            select(func.count(User.id)).scalar_subquery().label("users"),
+            select(func.count(FAQ.id)).scalar_subquery().label("faqs"),
+            select(func.count(ModerationLog.id)).scalar_subquery().label("moderations"),
+            select(func.count(ModerationLog.id))
+            .where(ModerationLog.action == "deleted")
+            .scalar_subquery()
+            .label("deleted"),
+        )
+
         async with get_db_session() as session:
-            user_count = await session.scalar(select(func.count(User.id)))
-            faq_count = await session.scalar(select(func.count(FAQ.id)))
-            moderation_count = await session.scalar(select(func.count(ModerationLog.id)))
-
-            deleted_count = await session.scalar(
-                select(func.count(ModerationLog.id)).where(
-                    ModerationLog.action == "deleted"
-                )
-            )
+            row = (await session.execute(stats_stmt)).one()
+
+        user_count = row.users
+        faq_count = row.faqs
+        moderation_count = row.moderations
+        deleted_count = row.deleted
 
         stats_text = (
             "📊 **Bot Statistics**\n\n"
@@ -0,0 +1,55 @@
+"""
+Member Handler
+
+Welcomes new group members and registers them in the database.
+"""
+
+from telegram import Update
+from telegram.ext import ContextTypes
+
+from bot.services.welcome_service import WelcomeService
+from bot.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+welcome_service = WelcomeService()
+
+
+async def handle_new_member(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """
+    Handle new members joining the group
+
+    Registers all joined members with one batched upsert (Telegram can
+    deliver several joins in a single update) and sends one welcome message.
+    """
+    message = update.message
+    if not message or not message.new_chat_members:
+        return
+
+    rows = [
+        {
+            "telegram_id": member.id,
+            "username": member.username,
+            "first_name": member.first_name,
+            "last_name": member.last_name,
+        }
+        for member in message.new_chat_members
+        if not member.is_bot
+    ]
+
+    if not rows:
+        return
+
+    try:
+        users = await welcome_service.bulk_upsert_users(rows)
+        member_count = await welcome_service.get_member_count()
+
+        await message.reply_text(
+            welcome_service.format_welcome(users, member_count)
+        )
+
+        logger.info(f"Welcomed {len(users)} new members")
+
+    except Exception as e:
+        logger.error(f"Error handling new members: {e}", exc_info=True)
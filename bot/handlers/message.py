@@ -5,24 +5,91 @@ Processes all text messages in the group.
 Flow: Moderation → FAQ matching → Intelligent routing
 """
 
+import asyncio
+from collections import OrderedDict
+from typing import Optional
+
 from telegram import Update
 from telegram.ext import ContextTypes
 
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
 from bot.db.database import get_db_session
-from bot.db.models import User, Message
-from bot.services.moderation_service import ModerationService
-from bot.services.faq_service import FAQService
+from bot.db.models import User
+from bot.services.analysis_service import AnalysisService
+from bot.services.fast_moderation import contains_banned_term, is_suspicious
+from bot.services.message_writer import message_writer
+from bot.services.moderation_service import ModerationService, ModerationResult
+from bot.services.faq_service import faq_service
 from bot.services.routing_service import RoutingService
+from bot.services import user_cache
 from bot.utils.logger import get_logger
 from bot.utils.config import settings
 
 logger = get_logger(__name__)
 
 
+analysis_service = AnalysisService()
 moderation_service = ModerationService()
-faq_service = FAQService()
 routing_service = RoutingService()
 
+# Local fast path: most community messages are trivially clean ("hi",
+# "thanks", emoji) and shouldn't pay an LLM or embedding round-trip
+_FAST_PATH_MAX_LEN = 24
+
+# Recently matched FAQ questions keyed by normalized text - an exact repeat
+# of a known question is answered without embedding or LLM calls
+_recent_faq_matches: "OrderedDict[str, object]" = OrderedDict()
+_RECENT_FAQ_SIZE = 256
+
+
+def _fast_moderation(text: str) -> Optional[str]:
+    """
+    Cheap local moderation verdict
+
+    Returns:
+        "delete" for a banned-term hit, "pass" for a short message with no
+        spam keywords or URLs that can skip the LLM entirely, None when
+        the LLM should decide
+    """
+    if contains_banned_term(text):
+        return "delete"
+    if len(text) < _FAST_PATH_MAX_LEN and not is_suspicious(text):
+        return "pass"
+    return None
+
+
+def _remember_faq_match(normalized_text: str, faq_match):
+    """Cache a matched FAQ question for exact-repeat short-circuiting"""
+    _recent_faq_matches[normalized_text] = faq_match
+    _recent_faq_matches.move_to_end(normalized_text)
+    while len(_recent_faq_matches) > _RECENT_FAQ_SIZE:
+        _recent_faq_matches.popitem(last=False)
+
+
+def clear_recent_faq_matches():
+    """Drop all cached FAQ matches
+
+    Must be called whenever the FAQ set changes (admin add/delete), or the
+    cache keeps serving answers for FAQs that no longer exist.
+    """
+    _recent_faq_matches.clear()
+
+
+def _report_submit_failure(task: asyncio.Task):
+    """Log a failed message-row insert
+
+    The early-return paths (elevated users, cache hits, fast-path "pass")
+    never await the submit task, so without this a failed batch insert
+    only surfaces as "Task exception was never retrieved" noise at GC time.
+    """
+    if task.cancelled():
+        return
+    exc = task.exception()
+    if exc is not None:
+        logger.error("Message row was not stored: %s", exc)
+
 
 def _is_admin(telegram_id: int) -> bool:
     """Check if user is admin based on config"""
@@ -31,8 +98,7 @@ def _is_admin(telegram_id: int) -> bool:
 
 def _is_mentor(telegram_id: int) -> bool:
     """Check if user is mentor based on config"""
-    mentor_domains = settings.get_mentor_domains()
-    return any(telegram_id in mentor_ids for mentor_ids in mentor_domains.values())
+    return telegram_id in settings.get_all_mentor_ids()
 
 
 async def handle_message(update: Update, context: ContextTypes.DEFAULT_TYPE):
@@ -51,37 +117,95 @@ async def handle_message(update: Update, context: ContextTypes.DEFAULT_TYPE):
     text = message.text
     user = message.from_user
 
-    logger.info(f"Message from {user.id}: {text[:50]}...")
+    logger.info("Message from %s: %.50s...", user.id, text)
 
     try:
-        db_user = await _get_or_create_user(user)
-        db_message = await _store_message(db_user.id, message.message_id, text)
+        async with get_db_session() as session:
+            db_user = await _get_or_create_user(session, user)
+
+        # Message rows go through the batching writer: one multi-row INSERT
+        # per flush window instead of a transaction per message. The row ID
+        # only resolves when that batch flushes, so keep it as a task and
+        # await it where the ID is actually consumed (audit logs, mentor
+        # tags) - never ahead of the fast paths or the LLM round-trips
+        msg_id_task = asyncio.create_task(message_writer.submit({
+            "user_id": db_user.id,
+            "telegram_message_id": message.message_id,
+            "text": text,
+        }))
+        msg_id_task.add_done_callback(_report_submit_failure)
 
         # Check if user is admin or mentor - they bypass moderation, FAQ, and routing
         is_elevated_user = db_user.is_admin or db_user.is_mentor
 
         if is_elevated_user:
-            logger.info(f"Skipping moderation/FAQ/routing for {'admin' if db_user.is_admin else 'mentor'} {user.id}")
+            logger.info("Skipping moderation/FAQ/routing for %s %s",
+                        "admin" if db_user.is_admin else "mentor", user.id)
             return
 
-        should_delete = await _check_moderation(text, db_user.id, message.message_id)
-        if should_delete:
+        normalized_text = text.strip().lower()
+
+        # Local fast path before any LLM/embedding work
+        verdict = _fast_moderation(text)
+        if verdict == "delete":
             await message.delete()
-            logger.info(f"Deleted message from user {user.id}")
+            await moderation_service.log_result(
+                db_user.id, await msg_id_task, text,
+                ModerationResult(
+                    is_appropriate=False,
+                    category="harmful",
+                    confidence=1.0,
+                    reason="Banned term (local fast path)"
+                )
+            )
+            logger.info("Deleted message from user %s (fast path)", user.id)
             return
 
-        faq_match = await faq_service.find_matching_faq(text)
-        if faq_match:
-            # Use plain text for FAQ responses to avoid Markdown parsing issues with URLs
-            await message.reply_text(
-                f"💡 FAQ Match\n\n"
-                f"Q: {faq_match.faq.question}\n\n"
-                f"A: {faq_match.faq.answer}"
+        # Exact repeat of a recently matched FAQ question - answer from cache
+        cached_match = _recent_faq_matches.get(normalized_text)
+        if cached_match is not None:
+            await _reply_with_faq(message, cached_match)
+            return
+
+        if verdict == "pass":
+            # Short, URL-free message - trivially clean, nothing to route
+            return
+
+        # FAQ matching (embedding call + pgvector query) doesn't depend on
+        # the moderation verdict, so overlap it with the fused analysis
+        # call - both are network-bound and run in one round-trip of wall
+        # time instead of two
+        faq_task = asyncio.create_task(faq_service.find_matching_faq(text))
+
+        # One fused LLM call covers moderation, FAQ category and routing -
+        # the message text is sent once instead of once per task
+        analysis = await analysis_service.analyze(text)
+
+        if moderation_service.should_delete(analysis.moderation):
+            faq_task.cancel()
+            await message.delete()
+            await moderation_service.log_result(
+                db_user.id, await msg_id_task, text, analysis.moderation
             )
-            logger.info(f"Replied with FAQ {faq_match.faq.id}")
+            logger.info("Deleted message from user %s", user.id)
             return
 
-        routing_decision = await routing_service.analyze_question(text)
+        faq_match = await faq_task
+        if faq_match:
+            _remember_faq_match(normalized_text, faq_match)
+            await _reply_with_faq(message, faq_match)
+
+        # Audit log after the user-visible reply: waiting on the batched
+        # row ID here costs nothing the user can see
+        message_db_id = await msg_id_task
+        await moderation_service.log_result(
+            db_user.id, message_db_id, text, analysis.moderation
+        )
+
+        if faq_match:
+            return
+
+        routing_decision = analysis.routing
 
         if routing_decision.should_tag_mentors and routing_decision.domains:
             mentors = await routing_service.get_mentors_for_domains(
@@ -93,79 +217,73 @@ async def handle_message(update: Update, context: ContextTypes.DEFAULT_TYPE):
                     mentors,
                     routing_decision.domains
                 )
-                await message.reply_text(tag_message, parse_mode="Markdown")
 
-                await routing_service.tag_mentors(
-                    message_id=db_message.id,
-                    mentor_ids=[m.id for m in mentors],
-                    reason=", ".join(routing_decision.domains)
+                # Telegram reply and DB write are independent network calls -
+                # overlap them instead of paying both round-trips in sequence
+                results = await asyncio.gather(
+                    message.reply_text(tag_message, parse_mode="Markdown"),
+                    routing_service.tag_mentors(
+                        message_id=message_db_id,
+                        mentor_ids=[m.id for m in mentors],
+                        reason=", ".join(routing_decision.domains)
+                    ),
+                    return_exceptions=True
                 )
+                for result in results:
+                    if isinstance(result, Exception):
+                        logger.error("Mentor tagging step failed: %s", result)
 
-                logger.info(f"Tagged {len(mentors)} mentors for message {db_message.id}")
+                logger.info("Tagged %d mentors for message %s", len(mentors), message_db_id)
 
     except Exception as e:
         logger.error(f"Error handling message: {e}", exc_info=True)
 
 
-async def _get_or_create_user(telegram_user) -> User:
-    """Get user from DB or create if doesn't exist"""
-    async with get_db_session() as session:
-        from sqlalchemy import select
-        result = await session.execute(
-            select(User).where(User.telegram_id == telegram_user.id)
-        )
-        user = result.scalar_one_or_none()
-
-        # Check current role status from config
-        is_admin = _is_admin(telegram_user.id)
-        is_mentor = _is_mentor(telegram_user.id)
-
-        if not user:
-            # Create new user with role flags
-            user = User(
-                telegram_id=telegram_user.id,
-                username=telegram_user.username,
-                first_name=telegram_user.first_name,
-                last_name=telegram_user.last_name,
-                is_admin=is_admin,
-                is_mentor=is_mentor
-            )
-            session.add(user)
-            await session.flush()
-            await session.refresh(user)
-        else:
-            # Update role flags if they've changed in config
-            if user.is_admin != is_admin or user.is_mentor != is_mentor:
-                user.is_admin = is_admin
-                user.is_mentor = is_mentor
-                await session.flush()
-                await session.refresh(user)
-
-        return user
-
-
-async def _store_message(user_id: int, telegram_message_id: int, text: str) -> Message:
-    """Store message in database"""
-    async with get_db_session() as session:
-        message = Message(
-            user_id=user_id,
-            telegram_message_id=telegram_message_id,
-            text=text
-        )
-        session.add(message)
-        await session.flush()
-        await session.refresh(message)
-        return message
-
-
-async def _check_moderation(text: str, user_id: int, telegram_message_id: int) -> bool:
-    """Check if message should be deleted"""
-    result = await moderation_service.check_content(
-        message_text=text,
-        user_id=user_id,
-        telegram_message_id=telegram_message_id
+async def _reply_with_faq(message, faq_match):
+    """Reply with a matched FAQ"""
+    # Use plain text for FAQ responses to avoid Markdown parsing issues with URLs
+    await message.reply_text(
+        f"💡 FAQ Match\n\n"
+        f"Q: {faq_match.faq.question}\n\n"
+        f"A: {faq_match.faq.answer}"
+    )
+    logger.info("Replied with FAQ %s", faq_match.faq.id)
+
+
+async def _get_or_create_user(session: AsyncSession, telegram_user) -> User:
+    """Upsert user in one INSERT ... ON CONFLICT round-trip"""
+    # Check current role status from config
+    is_admin = _is_admin(telegram_user.id)
+    is_mentor = _is_mentor(telegram_user.id)
+
+    stmt = pg_insert(User).values(
+        telegram_id=telegram_user.id,
+        username=telegram_user.username,
+        first_name=telegram_user.first_name,
+        last_name=telegram_user.last_name,
+        is_admin=is_admin,
+        is_mentor=is_mentor
     )
-    return moderation_service.should_delete(result)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["telegram_id"],
+        set_={
+            "username": stmt.excluded.username,
+            "first_name": stmt.excluded.first_name,
+            "last_name": stmt.excluded.last_name,
+            "is_admin": stmt.excluded.is_admin,
+            "is_mentor": stmt.excluded.is_mentor,
+        }
+    ).returning(User)
+
+    result = await session.execute(stmt)
+    db_user = result.scalar_one()
+    user_cache.remember(telegram_user.id, db_user.id)
+    return db_user
+
+
+# Translation table built once at import - escaping is a single C-level pass
+# instead of one str.replace per special character
+_MD_ESCAPE = str.maketrans({c: f"\\{c}" for c in "_*[]()~`>#+-=|{}.!"})
 
 
 def _escape_markdown(text: str) -> str:
@@ -178,10 +296,4 @@ def _escape_markdown(text: str) -> str:
     Returns:
         Escaped text safe for Markdown parsing
     """
-    # Markdown special characters that need escaping
-    special_chars = ['_', '*', '[', ']', '(', ')', '~', '`', '>', '#', '+', '-', '=', '|', '{', '}', '.', '!']
-
-    for char in special_chars:
-        text = text.replace(char, f'\\{char}')
-
-    return text
+    return text.translate(_MD_ESCAPE)
@@ -4,6 +4,8 @@ LLM Prompts - Centralized Prompt Management
 All bot prompts in one place for easy updates and version control.
 """
 
+import functools
+
 MODERATION_SYSTEM_PROMPT = """You are a content moderator for a tech-focused learning community on Telegram with 300+ members.
 
 Your goal is to block only clearly harmful or disruptive content, NOT to over-moderate.
@@ -116,26 +118,140 @@ ROUTING_USER_PROMPT = """Analyze this question:
 Should we tag mentors? If yes, which domains?"""
 
 
+# ============================================================================
+# COMBINED ANALYSIS PROMPT
+# ============================================================================
+# Moderation, FAQ classification and routing are independent judgements on
+# the same text - one fused call sends the message once instead of three times
+
+ANALYSIS_SYSTEM_PROMPT = """You are the message analyzer for a tech-focused learning community on Telegram with 300+ members.
+
+For each message, perform THREE independent tasks in a single pass:
+
+=== TASK 1: MODERATION ===
+Block only clearly harmful or disruptive content, NOT over-moderate.
+
+Flag content ONLY if it clearly is:
+1. **Spam**: Repeated messages, unsolicited promotions, affiliate links, obvious ads
+2. **Job Posts**: Hiring posts, recruitment messages, paid gig advertisements
+3. **Suspicious Links**: Phishing, malware, scam links, URL shorteners from unknown domains
+4. **Harmful Content**: Abuse, harassment, hate speech, profanity, explicit or dangerous content
+
+Be LENIENT with: ML/AI/tech discussions, career advice and job-search questions (NOT postings), project showcases, trusted GitHub/arXiv/blog links, casual chatter, beginner questions, greetings, simple Hindi or Hinglish messages.
+
+Always flag as "harmful" when the message contains profanity, slurs, insults, hostility, explicit content, hate speech, threats or harassment. When unsure about technical or casual language, allow it.
+
+=== TASK 2: FAQ CATEGORY ===
+Classify the question into one of: ml_basics, computer_vision, nlp, data_science, deep_learning, research, tools, career, other.
+
+=== TASK 3: ROUTING ===
+Mentor expertise domains:
+{mentor_domains}
+
+Decide:
+1. **Complexity**: simple, moderate, complex
+2. **Domains**: Which expertise domain(s) this belongs to
+3. **Should tag mentors?**:
+   - YES if: Complex/research questions, domain-specific, requires industry experience
+   - NO if: Simple questions the community can answer, already covered in FAQ
+
+Respond ONLY in JSON:
+{{
+    "moderation": {{
+        "is_appropriate": true/false,
+        "category": "clean" | "spam" | "job_post" | "suspicious_link" | "harmful",
+        "confidence": 0.0 to 1.0,
+        "reason": "Short, clear explanation"
+    }},
+    "faq": {{
+        "category": "category name"
+    }},
+    "routing": {{
+        "complexity": "simple" | "moderate" | "complex",
+        "domains": ["domain1", "domain2"],
+        "should_tag_mentors": true/false,
+        "reason": "Brief explanation",
+        "suggested_mentors": ["domain1", "domain2"] or []
+    }}
+}}"""
+
+ANALYSIS_USER_PROMPT = """Analyze this message:
+
+{message_text}
+
+Perform all three tasks and respond in JSON format."""
+
+
 # ============================================================================
 # HELPER FUNCTIONS
 # ============================================================================
 
+def _compile_formatter(name: str, template: str, params: tuple):
+    """
+    Compile a template into a specialized f-string function
+
+    The generated function renders with f-string bytecode (a handful of
+    opcodes) instead of re-running str.format's parsing machinery per
+    call. {placeholders} become interpolations; {{ }} stay literal braces,
+    exactly as with .format().
+    """
+    source = f"def {name}({', '.join(params)}):\n    return f{template!r}"
+    namespace = {}
+    exec(compile(source, "<prompts>", "exec"), namespace)
+    return namespace[name]
+
+
+_fmt_moderation = _compile_formatter(
+    "_fmt_moderation", MODERATION_USER_PROMPT, ("message_text",))
+_fmt_faq_classification = _compile_formatter(
+    "_fmt_faq_classification", FAQ_CLASSIFICATION_USER_PROMPT, ("question",))
+_fmt_routing_user = _compile_formatter(
+    "_fmt_routing_user", ROUTING_USER_PROMPT, ("question",))
+_fmt_routing_system = _compile_formatter(
+    "_fmt_routing_system", ROUTING_SYSTEM_PROMPT, ("mentor_domains",))
+_fmt_analysis_user = _compile_formatter(
+    "_fmt_analysis_user", ANALYSIS_USER_PROMPT, ("message_text",))
+_fmt_analysis_system = _compile_formatter(
+    "_fmt_analysis_system", ANALYSIS_SYSTEM_PROMPT, ("mentor_domains",))
+
+
+@functools.lru_cache(maxsize=4)
+def _format_domains_cached(domain_counts: tuple) -> str:
+    """Render the mentor-domains header block for a registry snapshot"""
+    return "\n".join(f"- {domain}: {count} mentors"
+                     for domain, count in domain_counts)
+
+
+def _format_domains(mentor_domains: dict) -> str:
+    """Render the mentor-domains header block
+
+    The registry only changes on admin action, so per-message rendering
+    collapses to building the hashable key plus one cache lookup.
+    """
+    return _format_domains_cached(
+        tuple((domain, len(mentors)) for domain, mentors in mentor_domains.items())
+    )
+
+
 def format_moderation_prompt(message_text: str) -> str:
     """Format moderation prompt with message text"""
-    return MODERATION_USER_PROMPT.format(message_text=message_text)
+    return _fmt_moderation(message_text)
 
 
 def format_faq_classification_prompt(question: str) -> str:
     """Format FAQ classification prompt with question"""
-    return FAQ_CLASSIFICATION_USER_PROMPT.format(question=question)
+    return _fmt_faq_classification(question)
 
 
 def format_routing_prompt(question: str, mentor_domains: dict) -> str:
     """Format routing prompt with question and mentor domains"""
-    # Format mentor domains for display
-    domains_text = "\n".join([f"- {domain}: {len(mentors)} mentors"
-                               for domain, mentors in mentor_domains.items()])
+    return _fmt_routing_user(question), _fmt_routing_system(
+        _format_domains(mentor_domains)
+    )
+
 
-    return ROUTING_USER_PROMPT.format(
-        question=question
-    ), ROUTING_SYSTEM_PROMPT.format(mentor_domains=domains_text)
+def format_analysis_prompt(message_text: str, mentor_domains: dict) -> tuple:
+    """Format the fused moderation/FAQ/routing prompt"""
+    return _fmt_analysis_user(message_text), _fmt_analysis_system(
+        _format_domains(mentor_domains)
+    )
@@ -1,23 +1,47 @@
 """Anthropic Claude Provider Implementation"""
 
-import json
+import functools
 from typing import Optional
 
+import orjson
 from anthropic import AsyncAnthropic, AnthropicError
 
-from bot.llm.wrapper import LLMProvider
+from bot.llm.wrapper import (
+    LLMProvider,
+    JSONStreamScanner,
+    get_shared_http_client,
+    llm_semaphore,
+)
 from bot.utils.exceptions import LLMProviderError
 from bot.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
 
+@functools.lru_cache(maxsize=16)
+def _system_blocks(system_prompt: str) -> tuple:
+    """Structured system block, built once per distinct prompt constant
+
+    cache_control marks the (static) block for Anthropic's prompt cache,
+    reusing its KV state across calls and cutting input cost and
+    time-to-first-token.
+    """
+    return ({
+        "type": "text",
+        "text": system_prompt,
+        "cache_control": {"type": "ephemeral"}
+    },)
+
+
 class ClaudeProvider(LLMProvider):
     """Anthropic Claude provider"""
 
     def __init__(self, api_key: str, model: Optional[str] = None):
         super().__init__(api_key, model or "claude-3-5-sonnet-20241022")
-        self.client = AsyncAnthropic(api_key=api_key)
+        self.client = AsyncAnthropic(
+            api_key=api_key,
+            http_client=get_shared_http_client()
+        )
 
     async def generate(
         self,
@@ -27,19 +51,18 @@ class ClaudeProvider(LLMProvider):
         max_tokens: int = 500
     ) -> str:
         try:
-            kwargs = {"model": self.model, "max_tokens": max_tokens, "temperature": temperature}
-            if system_prompt:
-                kwargs["system"] = system_prompt
+            kwargs = self._request_kwargs(system_prompt, temperature, max_tokens)
 
-            response = await self.client.messages.create(
-                messages=[{"role": "user", "content": prompt}],
-                **kwargs
-            )
+            async with llm_semaphore:
+                response = await self.client.messages.create(
+                    messages=[{"role": "user", "content": prompt}],
+                    **kwargs
+                )
 
             return response.content[0].text.strip()
 
         except AnthropicError as e:
-            logger.error(f"Claude API error: {e}")
+            logger.error("Claude API error: %s", e)
             raise LLMProviderError(f"Claude API failed: {e}") from e
 
     async def generate_json(
@@ -49,21 +72,49 @@ class ClaudeProvider(LLMProvider):
         temperature: float = 0.7
     ) -> dict:
         try:
-            full_system = (system_prompt or "") + "\n\nRespond with valid JSON only."
-
-            response = await self.generate(
-                prompt=prompt,
-                system_prompt=full_system,
-                temperature=temperature,
-                max_tokens=1000
-            )
-
-            return json.loads(response)
-
-        except (AnthropicError, json.JSONDecodeError) as e:
-            logger.error(f"Claude JSON generation error: {e}")
+            # Stream the response and stop consuming as soon as the
+            # top-level JSON object closes - the verdict is available
+            # without waiting for trailing tokens or end-of-stream.
+            # (System prompts pass through verbatim: the JSON instruction
+            # lives in the static prompt constants, keeping the system
+            # block byte-identical and cacheable provider-side.)
+            scanner = JSONStreamScanner()
+            kwargs = self._request_kwargs(system_prompt, temperature, max_tokens=1000)
+
+            async with llm_semaphore:
+                async with self.client.messages.stream(
+                    messages=[{"role": "user", "content": prompt}],
+                    **kwargs
+                ) as stream:
+                    async for delta in stream.text_stream:
+                        if scanner.feed(delta):
+                            break
+
+            raw = scanner.text()
+            start = raw.find("{")
+            if start < 0:
+                raise orjson.JSONDecodeError("no JSON object in response", raw, 0)
+            # Slice the exact object (drops markdown fences either side) and
+            # parse with orjson's SIMD decoder
+            end = scanner.end if scanner.end is not None else len(raw)
+            return orjson.loads(raw[start:end])
+
+        except (AnthropicError, orjson.JSONDecodeError) as e:
+            logger.error("Claude JSON generation error: %s", e)
             raise LLMProviderError(f"Claude JSON generation failed: {e}") from e
 
+    def _request_kwargs(
+        self,
+        system_prompt: Optional[str],
+        temperature: float,
+        max_tokens: int
+    ) -> dict:
+        """Build shared messages.create/stream keyword arguments"""
+        kwargs = {"model": self.model, "max_tokens": max_tokens, "temperature": temperature}
+        if system_prompt:
+            kwargs["system"] = _system_blocks(system_prompt)
+        return kwargs
+
     async def get_embedding(self, text: str) -> list[float]:
         """
         Claude doesn't have native embeddings API.
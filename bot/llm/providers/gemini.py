@@ -1,12 +1,12 @@
 """Google Gemini Provider Implementation"""
 
-import json
 from typing import Optional
 
+import orjson
 import google.generativeai as genai
 from google.api_core import exceptions as google_exceptions
 
-from bot.llm.wrapper import LLMProvider
+from bot.llm.wrapper import LLMProvider, JSONStreamScanner, llm_semaphore
 from bot.utils.exceptions import LLMProviderError
 from bot.utils.logger import get_logger
 
@@ -36,15 +36,16 @@ class GeminiProvider(LLMProvider):
                 max_output_tokens=max_tokens
             )
 
-            response = await self.model_instance.generate_content_async(
-                full_prompt,
-                generation_config=generation_config
-            )
+            async with llm_semaphore:
+                response = await self.model_instance.generate_content_async(
+                    full_prompt,
+                    generation_config=generation_config
+                )
 
             return response.text.strip()
 
         except google_exceptions.GoogleAPIError as e:
-            logger.error(f"Gemini API error: {e}")
+            logger.error("Gemini API error: %s", e)
             raise LLMProviderError(f"Gemini API failed: {e}") from e
 
     async def generate_json(
@@ -54,19 +55,44 @@ class GeminiProvider(LLMProvider):
         temperature: float = 0.7
     ) -> dict:
         try:
-            full_system = (system_prompt or "") + "\n\nRespond with valid JSON only."
+            # No per-call suffix: keeping the system prompt byte-identical
+            # across calls lets provider-side prompt caching key on it
+            full_prompt = f"{system_prompt}\n\n{prompt}" if system_prompt else prompt
 
-            response = await self.generate(
-                prompt=prompt,
-                system_prompt=full_system,
+            # Native JSON mode: the decoder is constrained to emit valid
+            # JSON, so no output tokens are wasted on prose or fences and
+            # malformed-JSON retries disappear
+            generation_config = genai.types.GenerationConfig(
                 temperature=temperature,
-                max_tokens=1000
+                max_output_tokens=1000,
+                response_mime_type="application/json"
             )
 
-            return json.loads(response)
-
-        except (google_exceptions.GoogleAPIError, json.JSONDecodeError) as e:
-            logger.error(f"Gemini JSON generation error: {e}")
+            # Stream and stop consuming once the top-level JSON object
+            # closes instead of buffering to end-of-stream
+            scanner = JSONStreamScanner()
+            async with llm_semaphore:
+                response = await self.model_instance.generate_content_async(
+                    full_prompt,
+                    generation_config=generation_config,
+                    stream=True
+                )
+
+                async for chunk in response:
+                    if chunk.text and scanner.feed(chunk.text):
+                        break
+
+            raw = scanner.text()
+            start = raw.find("{")
+            if start < 0:
+                raise orjson.JSONDecodeError("no JSON object in response", raw, 0)
+            # Slice the exact object (drops markdown fences either side) and
+            # parse with orjson's SIMD decoder
+            end = scanner.end if scanner.end is not None else len(raw)
+            return orjson.loads(raw[start:end])
+
+        except (google_exceptions.GoogleAPIError, orjson.JSONDecodeError) as e:
+            logger.error("Gemini JSON generation error: %s", e)
             raise LLMProviderError(f"Gemini JSON generation failed: {e}") from e
 
     async def get_embedding(self, text: str) -> list[float]:
@@ -79,5 +105,5 @@ class GeminiProvider(LLMProvider):
             return result['embedding']
 
         except google_exceptions.GoogleAPIError as e:
-            logger.error(f"Gemini embedding error: {e}")
+            logger.error("Gemini embedding error: %s", e)
             raise LLMProviderError(f"Gemini embedding failed: {e}") from e
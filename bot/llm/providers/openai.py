@@ -1,24 +1,42 @@
 """OpenAI Provider Implementation"""
 
-import json
+import asyncio
+import functools
 from typing import Optional
 
+import orjson
 from openai import AsyncOpenAI
 from openai import OpenAIError
 
-from bot.llm.wrapper import LLMProvider
+from bot.llm.wrapper import LLMProvider, get_shared_http_client, llm_semaphore
 from bot.utils.exceptions import LLMProviderError
 from bot.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Coalescing window for embedding requests: concurrent callers within the
+# window share one multi-input API call instead of one HTTPS round-trip each
+_EMBED_BATCH_MAX = 64
+_EMBED_BATCH_WINDOW = 0.01
+
+
+@functools.lru_cache(maxsize=16)
+def _system_message(system_prompt: str) -> dict:
+    """System message dict, built once per distinct prompt constant"""
+    return {"role": "system", "content": system_prompt}
+
 
 class OpenAIProvider(LLMProvider):
     """OpenAI GPT provider"""
 
     def __init__(self, api_key: str, model: Optional[str] = None):
         super().__init__(api_key, model or "gpt-4o-mini")
-        self.client = AsyncOpenAI(api_key=api_key)
+        self.client = AsyncOpenAI(
+            api_key=api_key,
+            http_client=get_shared_http_client()
+        )
+        self._embed_queue: Optional[asyncio.Queue] = None
+        self._embed_task: Optional[asyncio.Task] = None
 
     async def generate(
         self,
@@ -28,22 +46,22 @@ class OpenAIProvider(LLMProvider):
         max_tokens: int = 500
     ) -> str:
         try:
-            messages = []
+            messages = [{"role": "user", "content": prompt}]
             if system_prompt:
-                messages.append({"role": "system", "content": system_prompt})
-            messages.append({"role": "user", "content": prompt})
+                messages.insert(0, _system_message(system_prompt))
 
-            response = await self.client.chat.completions.create(
-                model=self.model,
-                messages=messages,
-                temperature=temperature,
-                max_tokens=max_tokens
-            )
+            async with llm_semaphore:
+                response = await self.client.chat.completions.create(
+                    model=self.model,
+                    messages=messages,
+                    temperature=temperature,
+                    max_tokens=max_tokens
+                )
 
             return response.choices[0].message.content.strip()
 
         except OpenAIError as e:
-            logger.error(f"OpenAI API error: {e}")
+            logger.error("OpenAI API error: %s", e)
             raise LLMProviderError(f"OpenAI API failed: {e}") from e
 
     async def generate_json(
@@ -53,33 +71,105 @@ class OpenAIProvider(LLMProvider):
         temperature: float = 0.7
     ) -> dict:
         try:
-            messages = []
+            messages = [{"role": "user", "content": prompt}]
             if system_prompt:
-                messages.append({"role": "system", "content": system_prompt})
-            messages.append({"role": "user", "content": prompt})
-
-            response = await self.client.chat.completions.create(
-                model=self.model,
-                messages=messages,
-                temperature=temperature,
-                response_format={"type": "json_object"}
-            )
-
-            content = response.choices[0].message.content.strip()
-            return json.loads(content)
-
-        except (OpenAIError, json.JSONDecodeError) as e:
-            logger.error(f"OpenAI JSON generation error: {e}")
+                messages.insert(0, _system_message(system_prompt))
+
+            async with llm_semaphore:
+                response = await self.client.chat.completions.create(
+                    model=self.model,
+                    messages=messages,
+                    temperature=temperature,
+                    response_format={"type": "json_object"}
+                )
+
+            # orjson parses the (guaranteed-JSON) payload with a SIMD
+            # decoder and tolerates surrounding whitespace itself
+            return orjson.loads(response.choices[0].message.content)
+
+        except (OpenAIError, orjson.JSONDecodeError) as e:
+            logger.error("OpenAI JSON generation error: %s", e)
             raise LLMProviderError(f"OpenAI JSON generation failed: {e}") from e
 
     async def get_embedding(self, text: str) -> list[float]:
+        # Enqueue and wait: the drain task coalesces everything submitted
+        # within the batch window into one embeddings.create call
+        if self._embed_task is None or self._embed_task.done():
+            self._embed_queue = asyncio.Queue()
+            self._embed_task = asyncio.create_task(self._drain_embed_queue())
+
+        future = asyncio.get_running_loop().create_future()
+        await self._embed_queue.put((text, future))
+        return await future
+
+    async def get_embeddings(self, texts: list[str]) -> list[list[float]]:
+        # Already a batch: skip the coalescing queue and embed in one call
         try:
-            response = await self.client.embeddings.create(
-                model="text-embedding-3-small",
-                input=text
-            )
-            return response.data[0].embedding
+            async with llm_semaphore:
+                response = await self.client.embeddings.create(
+                    model="text-embedding-3-small",
+                    input=texts
+                )
+            return [item.embedding for item in response.data]
 
         except OpenAIError as e:
-            logger.error(f"OpenAI embedding error: {e}")
+            logger.error("OpenAI embedding error: %s", e)
             raise LLMProviderError(f"OpenAI embedding failed: {e}") from e
+
+    async def _drain_embed_queue(self):
+        """Collect queued embedding requests and issue batched API calls"""
+        loop = asyncio.get_running_loop()
+        queue = self._embed_queue
+        batch: list = []
+        try:
+            while True:
+                batch = [await queue.get()]
+                deadline = loop.time() + _EMBED_BATCH_WINDOW
+                while len(batch) < _EMBED_BATCH_MAX:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        batch.append(
+                            await asyncio.wait_for(queue.get(), timeout)
+                        )
+                    except asyncio.TimeoutError:
+                        break
+                await self._embed_batch(batch)
+                batch = []
+        finally:
+            # If this task dies (cancellation - _embed_batch never raises),
+            # fail whatever it was holding so no caller awaits forever; a
+            # restarted drain task gets a fresh queue and never sees these
+            error = LLMProviderError("Embedding drain task stopped")
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(error)
+            while not queue.empty():
+                _, future = queue.get_nowait()
+                if not future.done():
+                    future.set_exception(error)
+
+    async def _embed_batch(self, batch: list):
+        """Embed a batch of texts in one API call and resolve each future
+
+        Never raises: any failure lands on the batch's futures, so the
+        drain loop survives to serve the next batch.
+        """
+        try:
+            async with llm_semaphore:
+                response = await self.client.embeddings.create(
+                    model="text-embedding-3-small",
+                    input=[text for text, _ in batch]
+                )
+            for (_, future), item in zip(batch, response.data):
+                if not future.done():
+                    future.set_result(item.embedding)
+
+        except Exception as e:
+            logger.error("OpenAI embedding error: %s", e, exc_info=True)
+            error = LLMProviderError(f"OpenAI embedding failed: {e}")
+            error.__cause__ = e
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(error)
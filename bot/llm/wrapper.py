@@ -8,9 +8,13 @@ Usage:
     response = await llm.generate("What is ML?")
 """
 
+import asyncio
+import functools
 from abc import ABC, abstractmethod
 from typing import Optional
 
+import httpx
+
 from bot.utils.config import settings
 from bot.utils.exceptions import LLMProviderError
 from bot.utils.logger import get_logger
@@ -18,13 +22,87 @@ from bot.utils.logger import get_logger
 logger = get_logger(__name__)
 
 
+# Bounded outgoing concurrency shared by every provider call: a burst of
+# gathered requests saturates up to the cap instead of tripping the
+# provider's rate tier and collapsing throughput on 429 backoffs
+llm_semaphore = asyncio.Semaphore(settings.LLM_MAX_CONCURRENCY)
+
+
+@functools.cache
+def get_shared_http_client() -> httpx.AsyncClient:
+    """
+    Shared HTTP connection pool for provider SDK clients
+
+    One pre-tuned pool means TLS sessions and keep-alive connections are
+    reused across all LLM traffic, and HTTP/2 multiplexes concurrent
+    requests over shared connections.
+    """
+    return httpx.AsyncClient(
+        http2=True,
+        timeout=30.0,
+        limits=httpx.Limits(
+            max_connections=100,
+            max_keepalive_connections=50
+        )
+    )
+
+
+class JSONStreamScanner:
+    """
+    Detects when a streamed response contains a complete JSON object
+
+    Providers feed text deltas as they arrive; feed() returns True as soon
+    as the top-level object closes, letting the caller stop consuming the
+    stream (and parse) without waiting for end-of-stream trailers.
+    """
+
+    def __init__(self):
+        self._parts = []
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+        self._started = False
+        self._length = 0
+        # Offset one past the closing brace, once seen - lets the caller
+        # slice the exact object out of the buffer
+        self.end: Optional[int] = None
+
+    def feed(self, chunk: str) -> bool:
+        """Accumulate a delta; True once the top-level object is closed"""
+        self._parts.append(chunk)
+        for offset, ch in enumerate(chunk):
+            if self._escaped:
+                self._escaped = False
+            elif self._in_string:
+                if ch == "\\":
+                    self._escaped = True
+                elif ch == '"':
+                    self._in_string = False
+            elif ch == '"':
+                self._in_string = True
+            elif ch == "{":
+                self._depth += 1
+                self._started = True
+            elif ch == "}":
+                self._depth -= 1
+                if self._started and self._depth == 0:
+                    self.end = self._length + offset + 1
+                    return True
+        self._length += len(chunk)
+        return False
+
+    def text(self) -> str:
+        """Everything fed so far"""
+        return "".join(self._parts)
+
+
 class LLMProvider(ABC):
     """Abstract base class for LLM providers (OpenAI, Claude, Gemini)"""
 
     def __init__(self, api_key: str, model: Optional[str] = None):
         self.api_key = api_key
         self.model = model
-        logger.info(f"Initialized {self.__class__.__name__} with model {model}")
+        logger.info("Initialized %s with model %s", self.__class__.__name__, model)
 
     @abstractmethod
     async def generate(
@@ -52,6 +130,18 @@ class LLMProvider(ABC):
         """Get vector embedding for text (for FAQ similarity matching)"""
         pass
 
+    async def get_embeddings(self, texts: list[str]) -> list[list[float]]:
+        """
+        Get vector embeddings for many texts at once
+
+        Providers with a multi-input embeddings endpoint override this
+        with a single API call; the default fans out per-text requests
+        concurrently.
+        """
+        return list(await asyncio.gather(
+            *(self.get_embedding(text) for text in texts)
+        ))
+
 
 def get_llm_provider() -> LLMProvider:
     """Factory function to get LLM provider based on settings"""
@@ -74,12 +164,6 @@ def get_llm_provider() -> LLMProvider:
         )
 
 
-_llm_provider: Optional[LLMProvider] = None
-
-
-def get_llm() -> LLMProvider:
-    """Get global LLM provider instance (singleton)"""
-    global _llm_provider
-    if _llm_provider is None:
-        _llm_provider = get_llm_provider()
-    return _llm_provider
+# Singleton via functools.cache: the memoized lookup happens in C, with no
+# Python-level global access or None check per call
+get_llm = functools.cache(get_llm_provider)
@@ -13,8 +13,9 @@ from telegram.ext import (
 )
 
 from bot.db.database import init_db, close_db
-from bot.handlers import message, admin
-from bot.utils.config import settings
+from bot.handlers import message, admin, member
+from bot.services.message_writer import message_writer
+from bot.utils.config import settings, validate_config
 from bot.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -33,6 +34,8 @@ async def post_init(application: Application):
         await init_db()
         logger.info("Database initialized successfully")
 
+        message_writer.start()
+
         bot_info = await application.bot.get_me()
         logger.info(f"Bot started: @{bot_info.username} (ID: {bot_info.id})")
 
@@ -51,6 +54,7 @@ async def post_shutdown(application: Application):
     logger.info("Shutting down bot...")
 
     try:
+        await message_writer.stop()
         await close_db()
         logger.info("Database connections closed")
 
@@ -70,6 +74,10 @@ def main():
     """
     logger.info("Starting ML Bytes Telegram Bot...")
 
+    # Check the selected provider's API key up front - the only config
+    # check deferred past import (the rest is pydantic-validated there)
+    validate_config()
+
     application = (
         Application.builder()
         .token(settings.TELEGRAM_BOT_TOKEN)
@@ -92,6 +100,13 @@ def main():
         )
     )
 
+    application.add_handler(
+        MessageHandler(
+            filters.StatusUpdate.NEW_CHAT_MEMBERS,
+            member.handle_new_member
+        )
+    )
+
     application.add_error_handler(error_handler)
 
     logger.info("Bot handlers registered. Starting polling...")
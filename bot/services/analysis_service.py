@@ -0,0 +1,109 @@
+"""
+Analysis Service
+
+Fuses moderation, FAQ classification, and routing into one LLM call.
+The three prompts are independent judgements on the same message text, so a
+single structured-output call sends the text once and pays one round-trip
+instead of three.
+"""
+
+from dataclasses import dataclass
+
+from bot.llm.wrapper import get_llm
+from bot.llm.prompts import format_analysis_prompt
+from bot.services.moderation_service import ModerationResult
+from bot.services.routing_service import RoutingDecision
+from bot.utils.config import settings
+from bot.utils.exceptions import LLMProviderError
+from bot.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class Analysis:
+    """Result of the fused per-message analysis"""
+    moderation: ModerationResult
+    routing: RoutingDecision
+    faq_category: str
+
+
+class AnalysisService:
+    """Runs the fused moderation + FAQ + routing analysis"""
+
+    def __init__(self):
+        self.llm = get_llm()
+        self.mentor_domains = settings.get_mentor_domains()
+
+    async def analyze(self, message_text: str) -> Analysis:
+        """
+        Analyze a message in one LLM round-trip
+
+        Args:
+            message_text: The message text to analyze
+
+        Returns:
+            Analysis with moderation verdict, routing decision and FAQ category.
+            On LLM failure, a safe default (allow, don't tag) is returned.
+        """
+        try:
+            user_prompt, system_prompt = format_analysis_prompt(
+                message_text=message_text,
+                mentor_domains=self.mentor_domains
+            )
+
+            response = await self.llm.generate_json(
+                prompt=user_prompt,
+                system_prompt=system_prompt,
+                temperature=0.3
+            )
+
+            moderation = response.get("moderation") or {}
+            routing = response.get("routing") or {}
+            faq = response.get("faq") or {}
+
+            analysis = Analysis(
+                moderation=ModerationResult(
+                    is_appropriate=moderation.get("is_appropriate", True),
+                    category=moderation.get("category", "clean"),
+                    confidence=moderation.get("confidence", 0.5),
+                    reason=moderation.get("reason", "No specific reason")
+                ),
+                routing=RoutingDecision(
+                    complexity=routing.get("complexity", "moderate"),
+                    domains=routing.get("domains", []),
+                    should_tag_mentors=routing.get("should_tag_mentors", False),
+                    reason=routing.get("reason", "No specific reason"),
+                    suggested_mentors=routing.get("suggested_mentors", [])
+                ),
+                faq_category=faq.get("category", "other")
+            )
+
+            logger.info(
+                "Analysis: moderation=%s, should_tag=%s, faq_category=%s",
+                analysis.moderation.category,
+                analysis.routing.should_tag_mentors,
+                analysis.faq_category
+            )
+
+            return analysis
+
+        except LLMProviderError as e:
+            logger.error("Fused analysis failed: %s", e)
+            # Fail open: allow the message, don't tag mentors
+            return Analysis(
+                moderation=ModerationResult(
+                    is_appropriate=True,
+                    category="clean",
+                    confidence=0.0,
+                    reason=f"Analysis failed: {e}"
+                ),
+                routing=RoutingDecision(
+                    complexity="unknown",
+                    domains=[],
+                    should_tag_mentors=False,
+                    reason=f"Analysis failed: {e}",
+                    suggested_mentors=[]
+                ),
+                faq_category="other"
+            )
@@ -0,0 +1,151 @@
+"""
+Embedding Cache
+
+Process-local cache for the FAQ lookup hot path. Repeated messages are common
+in a community group (greetings, re-asked questions), so we avoid paying an
+embedding API round-trip and a database similarity scan for every message.
+
+Two tiers:
+1. Exact match: LRU of embeddings keyed by SHA-256 of the normalized text
+2. Semantic: recent query embeddings are kept in a small matrix; if a new
+   query is nearly identical (cosine >= threshold) to a recent one, the
+   cached FAQ result is reused and the database scan is skipped entirely
+"""
+
+import asyncio
+import hashlib
+from collections import OrderedDict
+from typing import Awaitable, Callable, List, Optional
+
+import numpy as np
+
+from bot.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+# Sentinel so callers can distinguish "cached None result" from "no cache hit"
+CACHE_MISS = object()
+
+
+class EmbeddingCache:
+    """Two-tier cache: exact-match LRU for embeddings, semantic reuse for results"""
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        result_size: int = 256,
+        similarity_threshold: float = 0.95
+    ):
+        self.maxsize = maxsize
+        self.result_size = result_size
+        self.similarity_threshold = similarity_threshold
+
+        # Tier 1: normalized-text hash -> embedding vector
+        self._embeddings: "OrderedDict[bytes, List[float]]" = OrderedDict()
+        self._lock = asyncio.Lock()
+
+        # Tier 2: recent query embeddings (unit-normalized) and their results
+        self._result_vectors: List[np.ndarray] = []
+        self._result_values: List[object] = []
+        self._result_matrix: Optional[np.ndarray] = None
+
+    @staticmethod
+    def _key(text: str) -> bytes:
+        """Cache key: SHA-256 of whitespace-stripped, lowercased text"""
+        return hashlib.sha256(text.strip().lower().encode("utf-8")).digest()
+
+    @staticmethod
+    def _normalize(embedding: List[float]) -> Optional[np.ndarray]:
+        """Convert to a unit-length float32 vector (None if zero vector)"""
+        vec = np.asarray(embedding, dtype=np.float32)
+        norm = float(np.linalg.norm(vec))
+        if norm == 0.0:
+            return None
+        return vec / norm
+
+    async def get_or_embed(
+        self,
+        text: str,
+        embed: Callable[[str], Awaitable[List[float]]]
+    ) -> List[float]:
+        """
+        Get embedding for text, calling the embedder only on cache miss
+
+        Args:
+            text: Text to embed
+            embed: Async function that produces the embedding on miss
+
+        Returns:
+            Embedding vector
+        """
+        key = self._key(text)
+
+        async with self._lock:
+            cached = self._embeddings.get(key)
+            if cached is not None:
+                self._embeddings.move_to_end(key)
+                return cached
+
+        # Call the API outside the lock so concurrent misses don't serialize
+        embedding = await embed(text)
+
+        async with self._lock:
+            self._embeddings[key] = embedding
+            self._embeddings.move_to_end(key)
+            while len(self._embeddings) > self.maxsize:
+                self._embeddings.popitem(last=False)
+
+        return embedding
+
+    def lookup_result(self, embedding: List[float]):
+        """
+        Look up a cached result for a near-duplicate query
+
+        Returns:
+            The cached result if a recent query was similar enough,
+            else CACHE_MISS
+        """
+        if not self._result_vectors:
+            return CACHE_MISS
+
+        query = self._normalize(embedding)
+        if query is None:
+            return CACHE_MISS
+
+        if self._result_matrix is None:
+            self._result_matrix = np.stack(self._result_vectors)
+
+        similarities = self._result_matrix @ query
+        best_idx = int(similarities.argmax())
+
+        if float(similarities[best_idx]) >= self.similarity_threshold:
+            return self._result_values[best_idx]
+
+        return CACHE_MISS
+
+    def store_result(self, embedding: List[float], result: object):
+        """Remember the result computed for this query embedding"""
+        query = self._normalize(embedding)
+        if query is None:
+            return
+
+        self._result_vectors.append(query)
+        self._result_values.append(result)
+        self._result_matrix = None
+
+        # Bound the semantic tier (drop oldest entries)
+        while len(self._result_vectors) > self.result_size:
+            self._result_vectors.pop(0)
+            self._result_values.pop(0)
+
+    def clear_results(self):
+        """Invalidate cached results (query embeddings stay valid)"""
+        self._result_vectors.clear()
+        self._result_values.clear()
+        self._result_matrix = None
+
+    def clear(self):
+        """Invalidate everything"""
+        self._embeddings.clear()
+        self.clear_results()
@@ -4,20 +4,50 @@ FAQ Service
 Handles FAQ matching using vector similarity search.
 """
 
+import asyncio
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional, Tuple
 
-from sqlalchemy import select, text
+import numpy as np
+from sqlalchemy import select, func, update
+
+# Optional SIMD kernel library: dispatches to AVX-512 VNNI / NEON at
+# runtime for the int8 similarity scan; NumPy remains the fallback
+try:
+    import simsimd
+except ImportError:  # pragma: no cover - optional dependency
+    simsimd = None
 
 from bot.db.database import get_db_session
 from bot.db.models import FAQ
 from bot.llm.wrapper import get_llm
+from bot.services.embedding_cache import EmbeddingCache, CACHE_MISS
 from bot.utils.config import settings
+from bot.utils.cosine_kernel import top1_scaled_dot
 from bot.utils.exceptions import LLMProviderError
 from bot.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Above this corpus size the in-process matrix stops paying for itself and
+# the pgvector HNSW index takes over
+_MATRIX_MAX_ROWS = 10_000
+
+
+def _normalized(embedding) -> np.ndarray:
+    """
+    Unit-normalize an embedding before it's stored
+
+    FAQ vectors are immutable after insertion, so paying the norm once at
+    write-time means cosine similarity against them collapses to a plain
+    dot product everywhere downstream.
+    """
+    vector = np.asarray(embedding, dtype=np.float32)
+    norm = float(np.linalg.norm(vector))
+    if norm:
+        vector = vector / norm
+    return vector
+
 
 @dataclass
 class FAQMatch:
@@ -32,6 +62,17 @@ class FAQService:
     def __init__(self):
         self.llm = get_llm()
         self.similarity_threshold = settings.FAQ_SIMILARITY_THRESHOLD
+        self.embedding_cache = EmbeddingCache()
+
+        # In-process similarity matrix for small corpora, loaded lazily:
+        # every FAQ embedding row-normalized then quantized to int8 with a
+        # per-row scale. Top-1 search is one int32-accumulated matvec
+        # instead of a DB round-trip, moving 4x fewer bytes than float32.
+        self._emb_matrix_i8: Optional[np.ndarray] = None
+        self._emb_scales: Optional[np.ndarray] = None
+        self._matrix_faqs: Optional[List[FAQ]] = None
+        self._matrix_unavailable = False
+        self._matrix_lock = asyncio.Lock()
 
     async def find_matching_faq(
         self,
@@ -49,90 +90,193 @@ class FAQService:
             Best FAQ match if similarity above threshold, else None
         """
         try:
-            question_embedding = await self.llm.get_embedding(question)
-
-            # Convert embedding list to PostgreSQL array literal format
-            # Using ARRAY constructor is more reliable with SQLAlchemy
-            embedding_values = ','.join(str(float(x)) for x in question_embedding)
-
-            # Use raw SQL to calculate cosine similarity in the database
-            # This is MUCH faster than loading all FAQs and calculating in Python
-            # Note: We use string formatting for the array since it's safe (we control the input)
-            # and parameterized binding doesn't work well with array types in raw SQL
-            query_str = f"""
-                SELECT
-                    id,
-                    question,
-                    answer,
-                    category,
-                    created_by,
-                    created_at,
-                    updated_at,
-                    times_matched,
-                    (
-                        -- Cosine similarity formula: (A · B) / (||A|| * ||B||)
-                        (
-                            SELECT SUM(a * b)
-                            FROM unnest(embedding) WITH ORDINALITY AS t1(a, ord)
-                            JOIN unnest(ARRAY[{embedding_values}]::float[]) WITH ORDINALITY AS t2(b, ord)
-                                ON t1.ord = t2.ord
-                        ) / (
-                            SQRT((SELECT SUM(a * a) FROM unnest(embedding) AS a)) *
-                            SQRT((SELECT SUM(b * b) FROM unnest(ARRAY[{embedding_values}]::float[]) AS b))
-                        )
-                    ) AS similarity
-                FROM faqs
-                WHERE embedding IS NOT NULL
-                ORDER BY similarity DESC
-                LIMIT :limit
-            """
-
-            query = text(query_str)
+            question_embedding = await self.embedding_cache.get_or_embed(
+                question,
+                self.llm.get_embedding
+            )
 
-            async with get_db_session() as session:
-                result = await session.execute(
-                    query,
-                    {'limit': top_k}
+            # Near-duplicate of a recent query? Reuse its result, skip the DB scan
+            cached_result = self.embedding_cache.lookup_result(question_embedding)
+            if cached_result is not CACHE_MISS:
+                logger.info("FAQ result served from semantic cache")
+                return cached_result
+
+            # Small corpora: one in-process BLAS matvec. Large corpora:
+            # pgvector HNSW walk in the database.
+            await self._ensure_matrix()
+            if self._emb_matrix_i8 is not None:
+                faq, similarity = await self._matrix_best_match(question_embedding)
+            else:
+                faq, similarity = await self._pgvector_best_match(
+                    question_embedding, top_k
                 )
-                row = result.fetchone()
 
-            if not row:
+            if faq is None:
                 logger.warning("No FAQs with embeddings found")
                 return None
 
-            # Extract values from the result row
-            similarity = float(row.similarity) if row.similarity else 0.0
-
             if similarity >= self.similarity_threshold:
-                # Fetch the full FAQ object for the response
-                async with get_db_session() as session:
-                    faq_result = await session.execute(
-                        select(FAQ).where(FAQ.id == row.id)
-                    )
-                    faq = faq_result.scalar_one()
-
                 logger.info(
-                    f"FAQ match found: {faq.id} "
-                    f"(similarity: {similarity:.2f})"
+                    "FAQ match found: %s (similarity: %.2f)",
+                    faq.id, similarity
                 )
-
-                await self._increment_match_count(faq.id)
-
-                return FAQMatch(faq=faq, similarity=similarity)
+                match = FAQMatch(faq=faq, similarity=similarity)
+                self.embedding_cache.store_result(question_embedding, match)
+                return match
 
             logger.info(
-                f"No FAQ match above threshold "
-                f"(best: {similarity:.2f})"
+                "No FAQ match above threshold (best: %.2f)", similarity
             )
+            self.embedding_cache.store_result(question_embedding, None)
             return None
 
         except LLMProviderError as e:
-            logger.error(f"FAQ matching failed: {e}")
+            logger.error("FAQ matching failed: %s", e)
             return None
         except Exception as e:
-            logger.error(f"FAQ matching error: {e}", exc_info=True)
+            logger.error("FAQ matching error: %s", e, exc_info=True)
             return None
 
+    async def _ensure_matrix(self):
+        """Lazily load the quantized embedding matrix for small corpora"""
+        if self._emb_matrix_i8 is not None or self._matrix_unavailable:
+            return
+
+        # Serialize the rebuild so a burst of questions right after startup
+        # (or a cache invalidation) loads the corpus once, not once each
+        async with self._matrix_lock:
+            if self._emb_matrix_i8 is not None or self._matrix_unavailable:
+                return
+            await self._load_matrix()
+
+    async def _load_matrix(self):
+        """Query the corpus and build the quantized matrix"""
+        async with get_db_session() as session:
+            count = await session.scalar(
+                select(func.count(FAQ.id)).where(FAQ.embedding.isnot(None))
+            )
+            if not count or count > _MATRIX_MAX_ROWS:
+                self._matrix_unavailable = True
+                return
+
+            result = await session.execute(
+                select(FAQ).where(FAQ.embedding.isnot(None))
+            )
+            faqs = list(result.scalars().all())
+
+        matrix = np.asarray(
+            [np.asarray(faq.embedding, dtype=np.float32) for faq in faqs],
+            dtype=np.float32
+        )
+        # New rows are stored unit-length already; this pass only matters
+        # for rows inserted before write-time normalization and costs one
+        # sweep per rebuild
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        normalized = matrix / norms
+
+        # Per-row symmetric int8 quantization: cosine similarity at 1536
+        # dims tolerates it with <1% recall loss, and the matrix shrinks 4x
+        scales = np.abs(normalized).max(axis=1, keepdims=True)
+        scales[scales == 0] = 1.0
+
+        self._matrix_faqs = faqs
+        self._emb_matrix_i8 = np.round(normalized / scales * 127.0).astype(np.int8)
+        self._emb_scales = (scales.ravel() / 127.0).astype(np.float32)
+        logger.info("Loaded FAQ embedding matrix (int8): %s", matrix.shape)
+
+    async def _matrix_best_match(
+        self,
+        question_embedding
+    ) -> Tuple[Optional[FAQ], float]:
+        """Top-1 cosine similarity via one matvec over the cached matrix"""
+        query = np.asarray(question_embedding, dtype=np.float32)
+        norm = float(np.linalg.norm(query))
+        if norm == 0.0:
+            return None, 0.0
+
+        normalized = query / norm
+        query_scale = float(np.abs(normalized).max())
+        if query_scale == 0.0:
+            return None, 0.0
+        query_i8 = np.round(normalized / query_scale * 127.0).astype(np.int8)
+
+        if simsimd is not None:
+            # int8 cosine in one native kernel; scales cancel out of the
+            # cosine ratio so no dequantization is needed
+            distances = np.asarray(
+                simsimd.cdist(
+                    query_i8[None, :], self._emb_matrix_i8, metric="cosine"
+                )
+            ).ravel()
+            index = int(distances.argmin())
+            similarity = 1.0 - float(distances[index])
+        elif top1_scaled_dot is not None:
+            # Fused JIT reduction: dot, dequantize and track the best row
+            # in one pass, no intermediate similarity array
+            index, best_scaled = top1_scaled_dot(
+                self._emb_matrix_i8, query_i8, self._emb_scales
+            )
+            index = int(index)
+            similarity = float(best_scaled) * (query_scale / 127.0)
+        else:
+            # int32-accumulated matvec over the int8 matrix (dtype= avoids
+            # materializing an int32 copy of the matrix)
+            dots = np.matmul(self._emb_matrix_i8, query_i8, dtype=np.int32)
+            similarities = (
+                dots.astype(np.float32) * self._emb_scales * (query_scale / 127.0)
+            )
+            index = int(similarities.argmax())
+            similarity = float(similarities[index])
+        faq = self._matrix_faqs[index]
+
+        if similarity >= self.similarity_threshold:
+            # Counter bump is the only DB touch on this path
+            async with get_db_session() as session:
+                await session.execute(
+                    update(FAQ)
+                    .where(FAQ.id == faq.id)
+                    .values(times_matched=FAQ.times_matched + 1)
+                )
+
+        return faq, similarity
+
+    async def _pgvector_best_match(
+        self,
+        question_embedding,
+        top_k: int
+    ) -> Tuple[Optional[FAQ], float]:
+        """Top-1 cosine similarity via the pgvector HNSW index"""
+        distance = FAQ.embedding.cosine_distance(question_embedding)
+
+        # Single session for both the similarity query and the counter
+        # bump - one transaction and one connection checkout
+        async with get_db_session() as session:
+            result = await session.execute(
+                select(FAQ, (1 - distance).label("similarity"))
+                .where(FAQ.embedding.isnot(None))
+                .order_by(distance)
+                .limit(top_k)
+            )
+            row = result.first()
+
+            if not row:
+                return None, 0.0
+
+            faq = row[0]
+            similarity = float(row[1]) if row[1] is not None else 0.0
+
+            if similarity >= self.similarity_threshold:
+                # Atomic server-side increment: no read-modify-write
+                # round-trip and no lost updates under concurrency
+                await session.execute(
+                    update(FAQ)
+                    .where(FAQ.id == faq.id)
+                    .values(times_matched=FAQ.times_matched + 1)
+                )
+
+        return faq, similarity
+
     async def add_faq(
         self,
         question: str,
@@ -160,7 +304,7 @@ class FAQService:
                     question=question,
                     answer=answer,
                     category=category,
-                    embedding=embedding,
+                    embedding=_normalized(embedding),
                     created_by=created_by
                 )
                 session.add(faq)
@@ -168,17 +312,101 @@ class FAQService:
                 await session.refresh(faq)
 
                 logger.info(f"Created FAQ: {faq.id}")
+
+                # Cached results may no longer be the best match
+                self.clear_embedding_cache()
                 return faq
 
         except LLMProviderError as e:
             logger.error(f"Failed to create FAQ: {e}")
             raise
 
-    async def get_all_faqs(self) -> List[FAQ]:
-        """Get all FAQs"""
+    async def add_faqs_bulk(
+        self,
+        items: List[Tuple[str, str, Optional[str]]],
+        created_by: int | None = None
+    ) -> int:
+        """
+        Add many FAQs with one batched embedding call and one INSERT
+
+        Args:
+            items: (question, answer, category) tuples
+            created_by: User ID who created them
+
+        Returns:
+            Number of FAQs created
+        """
+        if not items:
+            return 0
+
+        try:
+            embeddings = await self.llm.get_embeddings(
+                [question for question, _, _ in items]
+            )
+
+            async with get_db_session() as session:
+                session.add_all([
+                    FAQ(
+                        question=question,
+                        answer=answer,
+                        category=category,
+                        embedding=_normalized(embedding),
+                        created_by=created_by
+                    )
+                    for (question, answer, category), embedding
+                    in zip(items, embeddings)
+                ])
+                await session.flush()
+
+            logger.info("Created %d FAQs in bulk", len(items))
+            self.clear_embedding_cache()
+            return len(items)
+
+        except LLMProviderError as e:
+            logger.error(f"Failed to bulk-create FAQs: {e}")
+            raise
+
+    async def iter_faqs(self) -> AsyncIterator[FAQ]:
+        """
+        Stream all FAQs from the server in batches
+
+        Rows arrive 100 at a time instead of materializing the whole table
+        (each row carries a ~3 KB embedding) in memory at once.
+        """
+        async with get_db_session() as session:
+            stream = await session.stream_scalars(
+                select(FAQ).execution_options(yield_per=100)
+            )
+            async for faq in stream:
+                yield faq
+
+    async def list_faqs(self, limit: int = 20, offset: int = 0):
+        """
+        List FAQ summary rows for display
+
+        Pushes the limit into SQL and projects only the columns the listing
+        renders, so embeddings never cross the wire.
+
+        Args:
+            limit: Maximum rows to return
+            offset: Rows to skip
+
+        Returns:
+            Rows with (id, question, category, times_matched)
+        """
+        async with get_db_session() as session:
+            result = await session.execute(
+                select(FAQ.id, FAQ.question, FAQ.category, FAQ.times_matched)
+                .order_by(FAQ.id)
+                .limit(limit)
+                .offset(offset)
+            )
+            return result.all()
+
+    async def count_faqs(self) -> int:
+        """Total number of FAQs"""
         async with get_db_session() as session:
-            result = await session.execute(select(FAQ))
-            return list(result.scalars().all())
+            return await session.scalar(select(func.count(FAQ.id)))
 
     async def delete_faq(self, faq_id: int) -> bool:
         """Delete FAQ by ID"""
@@ -191,17 +419,27 @@ class FAQService:
             if faq:
                 await session.delete(faq)
                 logger.info(f"Deleted FAQ: {faq_id}")
+                self.clear_embedding_cache()
                 return True
 
             return False
 
-    async def _increment_match_count(self, faq_id: int):
-        """Increment FAQ match counter"""
-        async with get_db_session() as session:
-            result = await session.execute(
-                select(FAQ).where(FAQ.id == faq_id)
-            )
-            faq = result.scalar_one_or_none()
+    def clear_embedding_cache(self):
+        """
+        Invalidate cached FAQ results after the FAQ set changes
 
-            if faq:
-                faq.times_matched += 1
+        Only the result tier is dropped: a query's embedding doesn't change
+        when FAQs do, so the exact-match embedding LRU stays warm. The
+        in-process similarity matrix is rebuilt on next use.
+        """
+        self.embedding_cache.clear_results()
+        self._emb_matrix_i8 = None
+        self._emb_scales = None
+        self._matrix_faqs = None
+        self._matrix_unavailable = False
+
+
+# Shared instance: the caches and the quantized matrix are per-instance, so
+# every consumer (message handler, admin commands, scripts) must go through
+# the same one or admin-side invalidation never reaches the hot path
+faq_service = FAQService()
@@ -0,0 +1,58 @@
+"""
+Fast Moderation Path
+
+Local matchers that short-circuit obvious cases before any LLM
+round-trip: a banned-term scan for instant deletion and a spam
+prefilter that lets trivially clean messages skip moderation entirely.
+The configured terms are compiled once at import into single
+longest-first alternations, so a verdict costs one C-level regex scan
+(~µs) instead of a ~300-800 ms LLM call.
+
+Built on the stdlib re engine rather than an Aho-Corasick dependency:
+for the few dozen terms a community realistically configures, one
+compiled alternation of escaped literals performs equivalently.
+"""
+
+import re
+from typing import Optional
+
+from bot.utils.config import settings
+
+
+def _compile_terms(raw: str) -> Optional[re.Pattern]:
+    """Compile a comma-separated term list into one alternation pattern"""
+    terms = [t.strip() for t in raw.split(",") if t.strip()]
+    if not terms:
+        return None
+    # Longest terms first so overlapping entries match greedily
+    terms.sort(key=len, reverse=True)
+    return re.compile("|".join(re.escape(t) for t in terms), re.IGNORECASE)
+
+
+_PATTERN = _compile_terms(settings.BANNED_TERMS)
+_SPAM_PATTERN = _compile_terms(settings.SPAM_KEYWORDS)
+_URL_PATTERN = re.compile(r"https?://\S+", re.IGNORECASE)
+
+# Messages longer than this go to the LLM even without a keyword hit -
+# long walls of text are where subtle spam hides
+_SUSPICIOUS_LENGTH = 200
+
+
+def contains_banned_term(text: str) -> bool:
+    """Check text against the compiled banned-term pattern"""
+    return bool(_PATTERN and _PATTERN.search(text))
+
+
+def is_suspicious(text: str) -> bool:
+    """
+    Decide whether a message warrants the LLM moderation call
+
+    A message is suspicious if it contains a configured spam keyword, a
+    URL, or is long enough that the keyword scan can't vouch for it.
+    Everything else is trivially clean and skips the LLM entirely.
+    """
+    if len(text) >= _SUSPICIOUS_LENGTH:
+        return True
+    if _URL_PATTERN.search(text):
+        return True
+    return bool(_SPAM_PATTERN and _SPAM_PATTERN.search(text))
@@ -0,0 +1,127 @@
+"""
+Message Writer
+
+Buffers per-message INSERTs and flushes them as one multi-row statement.
+Chatty groups otherwise pay a transaction and an fsync per message; batching
+amortizes the commit cost and keeps pool checkouts flat under bursts.
+"""
+
+import asyncio
+from typing import List, Optional, Tuple
+
+from sqlalchemy import insert
+
+from bot.db.database import get_db_session
+from bot.db.models import Message
+from bot.utils.exceptions import DatabaseError
+from bot.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class MessageWriter:
+    """Batches Message rows into periodic multi-VALUES INSERTs"""
+
+    def __init__(self, max_batch: int = 100, flush_interval: float = 0.1):
+        self.max_batch = max_batch
+        self.flush_interval = flush_interval
+        self._queue: "asyncio.Queue[Tuple[dict, asyncio.Future]]" = asyncio.Queue()
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self):
+        """Start the background flush loop (idempotent)"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._flush_loop())
+
+    async def stop(self):
+        """Stop the flush loop, flushing anything still queued"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+        leftovers = []
+        while not self._queue.empty():
+            leftovers.append(self._queue.get_nowait())
+        if leftovers:
+            await self._flush(leftovers)
+
+    async def submit(self, row: dict) -> int:
+        """
+        Queue a message row for insertion
+
+        Args:
+            row: Column values for the messages table
+
+        Returns:
+            The database ID of the inserted row (resolved when the batch
+            containing it commits)
+        """
+        self.start()
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((row, future))
+        return await future
+
+    async def _flush_loop(self):
+        """Collect rows for up to flush_interval / max_batch, then flush"""
+        loop = asyncio.get_running_loop()
+        batch: List[Tuple[dict, asyncio.Future]] = []
+        try:
+            while True:
+                batch = [await self._queue.get()]
+
+                deadline = loop.time() + self.flush_interval
+
+                while len(batch) < self.max_batch:
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        break
+                    try:
+                        batch.append(
+                            await asyncio.wait_for(self._queue.get(), remaining)
+                        )
+                    except asyncio.TimeoutError:
+                        break
+
+                await self._flush(batch)
+                batch = []
+        finally:
+            # Cancellation can land mid-collection or mid-flush; fail the
+            # in-flight batch's futures so no submitter awaits forever.
+            # (Rows still in the queue are flushed by stop(); _flush never
+            # raises, so only cancellation gets here with a live batch.)
+            error = DatabaseError("Message writer stopped before this batch committed")
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(error)
+
+    async def _flush(self, batch: List[Tuple[dict, asyncio.Future]]):
+        """Insert the batch in one statement and resolve the waiting futures"""
+        rows = [row for row, _ in batch]
+
+        try:
+            async with get_db_session() as session:
+                result = await session.execute(
+                    insert(Message).returning(
+                        Message.id, sort_by_parameter_order=True
+                    ),
+                    rows
+                )
+                ids = list(result.scalars().all())
+
+        except Exception as e:
+            logger.error("Message batch insert failed: %s", e, exc_info=True)
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, future), row_id in zip(batch, ids):
+            if not future.done():
+                future.set_result(row_id)
+
+
+message_writer = MessageWriter()
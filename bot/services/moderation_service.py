@@ -1,21 +1,18 @@
 """
 Moderation Service
 
-Checks messages for spam, job posts, and suspicious links.
+Applies the deletion policy and records moderation verdicts in the audit
+log. The verdicts themselves come from the fused analysis call
+(AnalysisService) or the local fast paths in bot.services.fast_moderation.
 """
 
-import json
+import asyncio
 from dataclasses import dataclass
 from typing import Optional
 
-from sqlalchemy import select
-
 from bot.db.database import get_db_session
-from bot.db.models import ModerationLog, User, Message
-from bot.llm.wrapper import get_llm
-from bot.llm.prompts import MODERATION_SYSTEM_PROMPT, format_moderation_prompt
+from bot.db.models import ModerationLog
 from bot.utils.config import settings
-from bot.utils.exceptions import ModerationError, LLMProviderError
 from bot.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -31,98 +28,82 @@ class ModerationResult:
 
 
 class ModerationService:
-    """Handles content moderation using LLM"""
+    """Applies moderation policy and writes the audit log"""
 
     def __init__(self):
-        self.llm = get_llm()
         self.threshold = settings.MODERATION_CONFIDENCE_THRESHOLD
 
-    async def check_content(
+        # Strong references to in-flight audit-log tasks so the event loop
+        # doesn't garbage-collect them mid-write
+        self._pending_logs: set = set()
+
+    async def log_result(
         self,
-        message_text: str,
         user_id: int,
-        telegram_message_id: int
-    ) -> ModerationResult:
+        message_db_id: Optional[int],
+        message_text: str,
+        result: ModerationResult
+    ):
+        """Record an externally produced verdict in the audit log"""
+        self._log_in_background(
+            user_id=user_id,
+            message_db_id=message_db_id,
+            message_text=message_text,
+            result=result
+        )
+
+    def _log_in_background(self, **kwargs):
         """
-        Check if message content is appropriate
+        Take the audit-log write off the caller's critical path
 
-        Args:
-            message_text: The message text to check
-            user_id: Database user ID
-            telegram_message_id: Telegram message ID
+        The log is never read back on the hot path, so the verdict returns
+        as soon as it's known and the INSERT runs in a background task.
+        """
+        task = asyncio.create_task(self._log_moderation(**kwargs))
+        self._pending_logs.add(task)
+        task.add_done_callback(self._pending_logs.discard)
 
-        Returns:
-            ModerationResult with decision and reasoning
+    def _build_log_entry(
+        self,
+        user_id: int,
+        message_db_id: Optional[int],
+        message_text: str,
+        result: ModerationResult
+    ) -> ModerationLog:
+        """Build the audit row for a verdict
+
+        Callers pass the Message row's own ID, so no lookup is needed
+        before the INSERT.
         """
-        try:
-            prompt = format_moderation_prompt(message_text)
-
-            response = await self.llm.generate_json(
-                prompt=prompt,
-                system_prompt=MODERATION_SYSTEM_PROMPT,
-                temperature=0.3
-            )
-
-            result = ModerationResult(
-                is_appropriate=response.get("is_appropriate", True),
-                category=response.get("category", "clean"),
-                confidence=response.get("confidence", 0.5),
-                reason=response.get("reason", "No specific reason")
-            )
-
-            await self._log_moderation(
-                user_id=user_id,
-                telegram_message_id=telegram_message_id,
-                message_text=message_text,
-                result=result
-            )
-
-            logger.info(
-                f"Moderation check: user={user_id}, "
-                f"category={result.category}, "
-                f"confidence={result.confidence}"
-            )
-
-            return result
-
-        except LLMProviderError as e:
-            logger.error(f"LLM moderation failed: {e}")
-            raise ModerationError(f"Moderation check failed: {e}") from e
+        return ModerationLog(
+            message_id=message_db_id,
+            user_id=user_id,
+            action="deleted" if not result.is_appropriate else "allowed",
+            reason=result.category,
+            confidence=result.confidence,
+            message_text=message_text,
+            llm_provider=settings.LLM_PROVIDER
+        )
 
     async def _log_moderation(
         self,
         user_id: int,
-        telegram_message_id: int,
+        message_db_id: Optional[int],
         message_text: str,
         result: ModerationResult
     ):
         """Log moderation decision to database"""
         try:
             async with get_db_session() as session:
-                message_result = await session.execute(
-                    select(Message).where(
-                        Message.user_id == user_id,
-                        Message.telegram_message_id == telegram_message_id
-                    )
-                )
-                message = message_result.scalar_one_or_none()
-
-                action = "deleted" if not result.is_appropriate else "allowed"
-
-                log_entry = ModerationLog(
-                    message_id=message.id if message else None,
+                session.add(self._build_log_entry(
                     user_id=user_id,
-                    action=action,
-                    reason=result.category,
-                    confidence=result.confidence,
+                    message_db_id=message_db_id,
                     message_text=message_text,
-                    llm_provider=settings.LLM_PROVIDER
-                )
-
-                session.add(log_entry)
+                    result=result
+                ))
 
         except Exception as e:
-            logger.error(f"Failed to log moderation: {e}")
+            logger.error("Failed to log moderation: %s", e)
 
     def should_delete(self, result: ModerationResult) -> bool:
         """Decide if message should be deleted based on moderation result"""
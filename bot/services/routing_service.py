@@ -7,7 +7,7 @@ Intelligently routes questions to appropriate mentors.
 from dataclasses import dataclass
 from typing import List
 
-from sqlalchemy import select
+from sqlalchemy import insert, select
 
 from bot.db.database import get_db_session
 from bot.db.models import User, Message, MentorTag
@@ -20,6 +20,11 @@ from bot.utils.logger import get_logger
 logger = get_logger(__name__)
 
 
+# Translation table built once at import - escaping is a single C-level pass
+# instead of one str.replace per special character
+_MD_ESCAPE = str.maketrans({c: f"\\{c}" for c in "_*[]()~`>#+-=|{}.!"})
+
+
 @dataclass
 class RoutingDecision:
     """Result of routing analysis"""
@@ -37,6 +42,13 @@ class RoutingService:
         self.llm = get_llm()
         self.mentor_domains = settings.get_mentor_domains()
 
+        # Per-domain mentor IDs as frozensets, built once: resolving a
+        # routing decision is then a few set unions instead of list scans
+        self._domain_mentor_ids = {
+            domain: frozenset(mentor_ids)
+            for domain, mentor_ids in self.mentor_domains.items()
+        }
+
     async def analyze_question(self, question: str) -> RoutingDecision:
         """
         Analyze question and decide if mentors should be tagged
@@ -76,7 +88,7 @@ class RoutingService:
             return decision
 
         except LLMProviderError as e:
-            logger.error(f"Routing analysis failed: {e}")
+            logger.error("Routing analysis failed: %s", e)
             return RoutingDecision(
                 complexity="unknown",
                 domains=[],
@@ -100,11 +112,12 @@ class RoutingService:
         """
         mentor_ids = set()
         for domain in domains:
-            if domain in self.mentor_domains:
-                mentor_ids.update(self.mentor_domains[domain])
+            domain_ids = self._domain_mentor_ids.get(domain)
+            if domain_ids:
+                mentor_ids |= domain_ids
 
         if not mentor_ids:
-            logger.warning(f"No mentors found for domains: {domains}")
+            logger.warning("No mentors found for domains: %s", domains)
             return []
 
         async with get_db_session() as session:
@@ -116,7 +129,7 @@ class RoutingService:
             )
             mentors = list(result.scalars().all())
 
-        logger.info(f"Found {len(mentors)} mentors for domains: {domains}")
+        logger.info("Found %d mentors for domains: %s", len(mentors), domains)
         return mentors
 
     async def tag_mentors(
@@ -133,16 +146,25 @@ class RoutingService:
             mentor_ids: List of mentor user IDs to tag
             reason: Reason for tagging (e.g., "computer_vision_expert")
         """
+        if not mentor_ids:
+            return
+
         async with get_db_session() as session:
-            for mentor_id in mentor_ids:
-                tag = MentorTag(
-                    message_id=message_id,
-                    mentor_id=mentor_id,
-                    reason=reason
-                )
-                session.add(tag)
+            # Core executemany INSERT: one statement for all tags, with no
+            # per-row ORM object construction or identity-map bookkeeping
+            await session.execute(
+                insert(MentorTag),
+                [
+                    {
+                        "message_id": message_id,
+                        "mentor_id": mentor_id,
+                        "reason": reason
+                    }
+                    for mentor_id in mentor_ids
+                ]
+            )
 
-            logger.info(f"Tagged {len(mentor_ids)} mentors for message {message_id}")
+            logger.info("Tagged %d mentors for message %s", len(mentor_ids), message_id)
 
     def format_mentor_tags(self, mentors: List[User], domains: List[str]) -> str:
         """
@@ -188,10 +210,4 @@ class RoutingService:
         Returns:
             Escaped text safe for Markdown parsing
         """
-        # Markdown special characters that need escaping
-        special_chars = ['_', '*', '[', ']', '(', ')', '~', '`', '>', '#', '+', '-', '=', '|', '{', '}', '.', '!']
-
-        for char in special_chars:
-            text = text.replace(char, f'\\{char}')
-
-        return text
+        return text.translate(_MD_ESCAPE)
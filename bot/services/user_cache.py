@@ -0,0 +1,67 @@
+"""
+User ID Cache
+
+Resolves Telegram user IDs to internal database primary keys.
+
+The mapping never changes once a user row exists, so admin commands don't
+need a SELECT (and a pooled-connection checkout) per invocation just to
+fill in a foreign key. Entries expire after a short TTL as a safety net
+against out-of-band row deletions.
+"""
+
+import time
+from typing import Optional
+
+from sqlalchemy import select, bindparam
+
+from bot.db.database import get_db_session
+from bot.db.models import User
+from bot.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+_TTL_SECONDS = 300.0
+_MAX_ENTRIES = 1024
+
+# telegram_id -> (user.id, expiry timestamp)
+_cache: dict = {}
+
+# Built once at import so cache misses reuse the compiled statement
+_USER_ID_BY_TELEGRAM_ID = select(User.id).where(User.telegram_id == bindparam("tid"))
+
+
+async def resolve_user_id(telegram_id: int) -> Optional[int]:
+    """
+    Get the internal user.id for a Telegram ID, hitting the DB only on miss
+
+    Args:
+        telegram_id: Telegram user ID
+
+    Returns:
+        Internal database user ID, or None if the user has no row yet
+    """
+    entry = _cache.get(telegram_id)
+    if entry is not None and entry[1] > time.monotonic():
+        return entry[0]
+
+    async with get_db_session() as session:
+        result = await session.execute(_USER_ID_BY_TELEGRAM_ID, {"tid": telegram_id})
+        user_db_id = result.scalar_one_or_none()
+
+    if user_db_id is not None:
+        remember(telegram_id, user_db_id)
+
+    return user_db_id
+
+
+def remember(telegram_id: int, user_db_id: int):
+    """Record a known mapping (called after user upserts)"""
+    if len(_cache) >= _MAX_ENTRIES:
+        # Rare at this cap; dropping everything beats tracking recency
+        _cache.clear()
+    _cache[telegram_id] = (user_db_id, time.monotonic() + _TTL_SECONDS)
+
+
+def invalidate(telegram_id: int):
+    """Drop a cached mapping"""
+    _cache.pop(telegram_id, None)
@@ -0,0 +1,110 @@
+"""
+Welcome Service
+
+Registers new group members and builds the welcome message.
+"""
+
+import time
+from typing import List, Optional, Tuple
+
+from sqlalchemy import select, func, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from bot.db.database import get_db_session
+from bot.db.models import User
+from bot.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# The welcome banner's member count doesn't need to be live or exact
+_COUNT_TTL_SECONDS = 60.0
+
+# Below this size the planner estimate is too coarse and an exact
+# COUNT(*) is cheap anyway
+_ESTIMATE_MIN_ROWS = 1000
+
+
+class WelcomeService:
+    """Handles new-member registration and welcome messages"""
+
+    def __init__(self):
+        self._count_cache: Optional[Tuple[int, float]] = None
+
+    async def bulk_upsert_users(self, rows: List[dict]) -> List[User]:
+        """
+        Upsert a batch of joined members in a single statement
+
+        Telegram can deliver several joins in one update; one
+        INSERT ... ON CONFLICT DO UPDATE ... RETURNING covers them all
+        in a single round-trip instead of one SELECT+INSERT per member.
+
+        Args:
+            rows: Dicts with telegram_id, username, first_name, last_name
+
+        Returns:
+            The upserted User objects
+        """
+        if not rows:
+            return []
+
+        stmt = pg_insert(User).values(rows)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["telegram_id"],
+            set_={
+                "username": stmt.excluded.username,
+                "first_name": stmt.excluded.first_name,
+                "last_name": stmt.excluded.last_name,
+            }
+        ).returning(User)
+
+        async with get_db_session() as session:
+            result = await session.execute(stmt)
+            users = list(result.scalars().all())
+
+        logger.info(f"Upserted {len(users)} joined members")
+        return users
+
+    async def get_member_count(self) -> int:
+        """
+        Total number of registered community members
+
+        Cached for a short TTL and served from the planner's row estimate
+        on larger tables, so a join burst doesn't run COUNT(*) sequential
+        scans over a growing users table.
+        """
+        now = time.monotonic()
+        if self._count_cache is not None and now < self._count_cache[1]:
+            return self._count_cache[0]
+
+        async with get_db_session() as session:
+            # O(1) catalog lookup of the statistics estimate instead of
+            # an O(N) sequential scan
+            estimate = await session.scalar(
+                text("SELECT reltuples::bigint FROM pg_class WHERE relname = 'users'")
+            )
+            if estimate is not None and estimate >= _ESTIMATE_MIN_ROWS:
+                count = int(estimate)
+            else:
+                count = await session.scalar(select(func.count(User.id)))
+
+        self._count_cache = (count, now + _COUNT_TTL_SECONDS)
+        return count
+
+    def format_welcome(self, users: List[User], member_count: int) -> str:
+        """
+        Build the welcome message for a batch of new members
+
+        Args:
+            users: Newly joined users
+            member_count: Current community size
+
+        Returns:
+            Plain-text welcome message
+        """
+        names = ", ".join(u.first_name or u.username or "there" for u in users)
+        return (
+            f"👋 Welcome {names}!\n\n"
+            f"You're member #{member_count} of the ML Bytes community. "
+            f"Ask questions freely - I'll match them against our FAQs "
+            f"and tag mentors when needed."
+        )
@@ -23,55 +23,56 @@ async def check_faqs():
     await init_db()
 
     async with get_db_session() as session:
-        # Get total count
-        total_count = await session.execute(select(func.count(FAQ.id)))
-        total = total_count.scalar()
-
-        # Get FAQs with embeddings
-        result_with_embeddings = await session.execute(
-            select(FAQ).where(FAQ.embedding.isnot(None))
-        )
-        faqs_with_embeddings = result_with_embeddings.scalars().all()
-
-        # Get FAQs without embeddings
-        result_without_embeddings = await session.execute(
-            select(FAQ).where(FAQ.embedding.is_(None))
-        )
-        faqs_without_embeddings = result_without_embeddings.scalars().all()
-
-        # Get all FAQs
-        all_result = await session.execute(select(FAQ))
-        all_faqs = all_result.scalars().all()
-
-    print("\n" + "="*70)
-    print("FAQ DATABASE STATUS")
-    print("="*70)
-    print(f"Total FAQs: {total}")
-    print(f"FAQs with embeddings: {len(faqs_with_embeddings)}")
-    print(f"FAQs without embeddings: {len(faqs_without_embeddings)}")
-    print("="*70)
-
-    if all_faqs:
+        # One aggregate round-trip: count(embedding) skips NULLs, so both
+        # totals come back in a single row
+        total, with_embeddings = (await session.execute(
+            select(func.count(FAQ.id), func.count(FAQ.embedding))
+        )).one()
+
         print("\n" + "="*70)
-        print("ALL FAQs IN DATABASE:")
+        print("FAQ DATABASE STATUS")
+        print("="*70)
+        print(f"Total FAQs: {total}")
+        print(f"FAQs with embeddings: {with_embeddings}")
+        print(f"FAQs without embeddings: {total - with_embeddings}")
         print("="*70)
-        for idx, faq in enumerate(all_faqs, 1):
-            has_embedding = "[YES]" if faq.embedding else "[NO]"
-            embedding_info = f"Embedding: {has_embedding}"
-            if faq.embedding:
-                embedding_info += f" (dimension: {len(faq.embedding)})"
-
-            print(f"\nFAQ #{faq.id}")
-            print(f"  Question: {faq.question[:80]}...")
-            print(f"  Answer: {faq.answer[:80]}...")
-            print(f"  Category: {faq.category or 'None'}")
-            print(f"  {embedding_info}")
-            print(f"  Times matched: {faq.times_matched}")
-            print(f"  Created at: {faq.created_at}")
-    else:
-        print("\n[!] NO FAQs FOUND IN DATABASE")
-        print("\nTo load FAQs, run:")
-        print("  python -m bot.utils.load_faqs")
+
+        if total:
+            print("\n" + "="*70)
+            print("ALL FAQs IN DATABASE:")
+            print("="*70)
+
+            # Stream display rows in server-side batches, projecting only
+            # what gets printed - the embeddings themselves (KBs per row)
+            # never cross the wire
+            stream = await session.stream(
+                select(
+                    FAQ.id,
+                    FAQ.question,
+                    FAQ.answer,
+                    FAQ.category,
+                    FAQ.times_matched,
+                    FAQ.created_at,
+                    FAQ.embedding.isnot(None).label("has_embedding"),
+                )
+                .order_by(FAQ.id)
+                .execution_options(yield_per=100)
+            )
+
+            async for row in stream:
+                has_embedding = "[YES]" if row.has_embedding else "[NO]"
+
+                print(f"\nFAQ #{row.id}")
+                print(f"  Question: {row.question[:80]}...")
+                print(f"  Answer: {row.answer[:80]}...")
+                print(f"  Category: {row.category or 'None'}")
+                print(f"  Embedding: {has_embedding}")
+                print(f"  Times matched: {row.times_matched}")
+                print(f"  Created at: {row.created_at}")
+        else:
+            print("\n[!] NO FAQs FOUND IN DATABASE")
+            print("\nTo load FAQs, run:")
+            print("  python -m bot.utils.load_faqs")
 
     print("="*70 + "\n")
 
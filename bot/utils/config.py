@@ -8,8 +8,9 @@ Usage:
     print(settings.TELEGRAM_BOT_TOKEN)
 """
 
+import functools
 import json
-from typing import Dict, List
+from typing import Dict, FrozenSet, List
 from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -27,6 +28,12 @@ class Settings(BaseSettings):
 
     DATABASE_URL: str = Field(..., description="PostgreSQL connection URL")
 
+    # Connection pool sizing (pool_size + max_overflow must stay below the
+    # Postgres max_connections limit)
+    DB_POOL_SIZE: int = Field(default=20, ge=1)
+    DB_MAX_OVERFLOW: int = Field(default=40, ge=0)
+    DB_POOL_TIMEOUT: int = Field(default=30, ge=1, description="Seconds to wait for a pooled connection")
+
     MENTOR_DOMAINS: str = Field(
         default='{"computer_vision": [], "research": [], "data_science": []}',
         description="JSON mapping of domains to mentor IDs"
@@ -35,7 +42,19 @@ class Settings(BaseSettings):
     LOG_LEVEL: str = Field(default="INFO")
     ENVIRONMENT: str = Field(default="development")
 
+    # Cap on simultaneous in-flight LLM API calls (keeps bursts under the
+    # provider's rate tier instead of surfacing 429s)
+    LLM_MAX_CONCURRENCY: int = Field(default=64, ge=1)
+
     MODERATION_CONFIDENCE_THRESHOLD: float = Field(default=0.7, ge=0.0, le=1.0)
+    BANNED_TERMS: str = Field(default="", description="Comma-separated terms deleted without an LLM call")
+    SPAM_KEYWORDS: str = Field(
+        default=(
+            "buy now,free money,click here,limited offer,earn from home,"
+            "dm me,crypto giveaway,guaranteed returns,hiring urgently"
+        ),
+        description="Comma-separated keywords that send a message to the LLM moderation check"
+    )
     FAQ_SIMILARITY_THRESHOLD: float = Field(default=0.85, ge=0.0, le=1.0)
 
     model_config = SettingsConfigDict(
@@ -65,14 +84,42 @@ class Settings(BaseSettings):
         return v
 
     # Helper methods
+    #
+    # cached_property rather than lru_cache: lru_cache on an instance
+    # method hashes self, and pydantic models aren't hashable, so the
+    # decorated methods raised TypeError on every call. The properties
+    # compute once and land in the instance __dict__.
+
+    @functools.cached_property
+    def admin_ids(self) -> FrozenSet[int]:
+        """Admin IDs parsed once from config (O(1) membership)"""
+        return frozenset(int(id_.strip()) for id_ in self.ADMIN_TELEGRAM_IDS.split(","))
+
+    @functools.cached_property
+    def mentor_domains(self) -> Dict[str, List[int]]:
+        """Mentor domain mapping parsed once from config"""
+        return json.loads(self.MENTOR_DOMAINS)
+
+    @functools.cached_property
+    def all_mentor_ids(self) -> FrozenSet[int]:
+        """All mentor IDs across domains, flattened for O(1) membership"""
+        return frozenset(
+            mentor_id
+            for mentor_ids in self.mentor_domains.values()
+            for mentor_id in mentor_ids
+        )
 
-    def get_admin_ids(self) -> List[int]:
-        """Parse comma-separated admin IDs"""
-        return [int(id_.strip()) for id_ in self.ADMIN_TELEGRAM_IDS.split(",")]
+    def get_admin_ids(self) -> FrozenSet[int]:
+        """Parse comma-separated admin IDs (parsed once, O(1) membership)"""
+        return self.admin_ids
 
     def get_mentor_domains(self) -> Dict[str, List[int]]:
         """Parse JSON mentor domains"""
-        return json.loads(self.MENTOR_DOMAINS)
+        return self.mentor_domains
+
+    def get_all_mentor_ids(self) -> FrozenSet[int]:
+        """All mentor IDs across domains, flattened for O(1) membership"""
+        return self.all_mentor_ids
 
     def get_llm_api_key(self) -> str:
         """Get API key for selected provider"""
@@ -97,10 +144,26 @@ class Settings(BaseSettings):
         return self.ENVIRONMENT.lower() == "production"
 
 
-settings = Settings()
+@functools.lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Build (and memoize) the validated Settings instance"""
+    return Settings()
+
+
+def validate_config():
+    """
+    Fail fast on a missing LLM provider API key
+
+    Called from the bot's startup entrypoint rather than at import, so
+    importing this module only requires the fields pydantic validates
+    (bot token, database URL, admin IDs) - not the API key of the
+    selected provider.
+    """
+    try:
+        get_settings().get_llm_api_key()
+    except ValueError as e:
+        print(f"Configuration Error: {e}")
+        raise
+
 
-try:
-    settings.get_llm_api_key()
-except ValueError as e:
-    print(f"Configuration Error: {e}")
-    raise
+settings = get_settings()
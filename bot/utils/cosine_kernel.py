@@ -0,0 +1,44 @@
+"""
+Fused Similarity Kernel
+
+Optional Numba-JIT reduction for the FAQ similarity fallback path. The
+plain NumPy chain (matvec, scale, argmax) makes three passes over memory
+and materializes two intermediate arrays; the jitted loop fuses dot
+product, per-row dequantization and best-match tracking into a single
+pass. The explicit signature makes Numba compile at import, so the JIT
+cost is paid at startup instead of on the first user message.
+
+The kernel is deliberately serial: a prange reduction can't track the
+best index race-free, and at the corpus sizes the in-process matrix
+serves (<=10k rows) one core saturates memory bandwidth anyway.
+"""
+
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover - optional dependency
+    njit = None
+
+
+if njit is not None:
+    @njit(
+        "Tuple((int64, float64))(int8[:, ::1], int8[::1], float32[::1])",
+        cache=True,
+        fastmath=True,
+    )
+    def top1_scaled_dot(matrix_i8, query_i8, scales):
+        """Best (index, scaled dot) over int8 rows with per-row scales"""
+        n, d = matrix_i8.shape
+        best_index = 0
+        best_score = -1e30
+        for i in range(n):
+            acc = 0
+            for j in range(d):
+                # Widen before multiplying: an int8*int8 product overflows
+                acc += int(matrix_i8[i, j]) * int(query_i8[j])
+            score = acc * scales[i]
+            if score > best_score:
+                best_score = score
+                best_index = i
+        return best_index, best_score
+else:
+    top1_scaled_dot = None
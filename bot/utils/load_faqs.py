@@ -10,7 +10,7 @@ import json
 from pathlib import Path
 
 from bot.db.database import init_db
-from bot.services.faq_service import FAQService
+from bot.services.faq_service import faq_service
 from bot.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -44,11 +44,9 @@ async def load_faqs_from_json(json_path: str):
 
     logger.info(f"Found {len(faqs_data)} FAQs to load")
 
-    # Initialize FAQ service
-    faq_service = FAQService()
-
-    # Add each FAQ to database
-    success_count = 0
+    # Validate everything up front so a malformed entry never costs an
+    # API call
+    items = []
     failed_count = 0
 
     for idx, faq_data in enumerate(faqs_data, 1):
@@ -61,22 +59,28 @@ async def load_faqs_from_json(json_path: str):
             failed_count += 1
             continue
 
-        try:
-            logger.info(f"Adding FAQ {idx}/{len(faqs_data)}: {question[:50]}...")
+        items.append((question, answer, category))
 
-            faq = await faq_service.add_faq(
-                question=question,
-                answer=answer,
-                category=category,
-                created_by=None  # System-added FAQs
-            )
+    # Bulk-add in chunks: one batched embeddings call plus one INSERT per
+    # chunk, with the chunks running concurrently, instead of a serial
+    # embed + insert round-trip per FAQ
+    success_count = 0
+    chunks = [items[i:i + 256] for i in range(0, len(items), 256)]
 
-            logger.info(f"[SUCCESS] Added FAQ {faq.id}: {question[:50]}...")
-            success_count += 1
+    results = await asyncio.gather(
+        *(faq_service.add_faqs_bulk(chunk) for chunk in chunks),
+        return_exceptions=True
+    )
 
-        except Exception as e:
-            logger.error(f"[FAILED] Failed to add FAQ {idx}: {e}")
-            failed_count += 1
+    for chunk, result in zip(chunks, results):
+        if isinstance(result, BaseException):
+            logger.error(
+                f"[FAILED] Failed to add chunk of {len(chunk)} FAQs: {result}"
+            )
+            failed_count += len(chunk)
+        else:
+            logger.info(f"[SUCCESS] Added {result} FAQs")
+            success_count += result
 
     logger.info(
         f"\n{'='*60}\n"
@@ -8,7 +8,10 @@ Usage:
 """
 
 import asyncio
-from sqlalchemy import select
+from collections import defaultdict
+
+from sqlalchemy import bindparam, select, update
+from sqlalchemy.orm import raiseload
 
 from bot.db.database import init_db, get_db_session
 from bot.db.models import User
@@ -29,13 +32,13 @@ async def sync_mentors():
     mentor_domains = settings.get_mentor_domains()
     logger.info(f"Mentor domains from config: {mentor_domains}")
 
-    # Collect all unique mentor IDs and their domains
-    mentor_info = {}  # telegram_id -> list of domains
+    # Collect all unique mentor IDs and their domains (defaultdict: one
+    # hash lookup per entry instead of a membership test plus two more).
+    # Sets dedupe IDs listed twice under one domain in the config.
+    mentor_info = defaultdict(set)  # telegram_id -> set of domains
     for domain, telegram_ids in mentor_domains.items():
         for telegram_id in telegram_ids:
-            if telegram_id not in mentor_info:
-                mentor_info[telegram_id] = []
-            mentor_info[telegram_id].append(domain)
+            mentor_info[telegram_id].add(domain)
 
     if not mentor_info:
         logger.warning("No mentors configured in MENTOR_DOMAINS")
@@ -46,33 +49,64 @@ async def sync_mentors():
     logger.info(f"Found {len(mentor_info)} unique mentors in configuration")
 
     # Update users in database
-    updated_count = 0
-    not_found_count = 0
-
     async with get_db_session() as session:
+        # One WHERE IN round-trip for every configured mentor instead of
+        # a SELECT per mentor (classic N+1). raiseload turns any future
+        # accidental lazy load during the summary printing into a loud
+        # error instead of a silent per-row SELECT storm.
+        result = await session.execute(
+            select(User)
+            .where(User.telegram_id.in_(mentor_info.keys()))
+            .options(raiseload("*"))
+        )
+        found = {user.telegram_id: user for user in result.scalars()}
+
+        # Only DB work happens inside the session scope; logging and
+        # printing run after the connection is back in the pool
+        update_params = []
+        missing = []
+        unchanged_count = 0
         for telegram_id, domains in mentor_info.items():
-            # Find user in database
-            result = await session.execute(
-                select(User).where(User.telegram_id == telegram_id)
+            user = found.get(telegram_id)
+            if user is None:
+                missing.append(telegram_id)
+                continue
+
+            # Sorted for a stable stored order across re-runs
+            sorted_domains = sorted(domains)
+
+            # Idempotent re-run short-circuit: a row that already holds
+            # exactly this state produces no UPDATE or WAL traffic
+            if user.is_mentor and (user.expertise_domains or []) == sorted_domains:
+                unchanged_count += 1
+                continue
+
+            update_params.append({"tid": telegram_id, "doms": sorted_domains})
+
+        if update_params:
+            # One Core executemany sets the flag and domains for every
+            # mentor - no per-row ORM mutation or unit-of-work flush
+            await session.execute(
+                update(User)
+                .where(User.telegram_id == bindparam("tid"))
+                .values(is_mentor=True, expertise_domains=bindparam("doms")),
+                update_params
             )
-            user = result.scalar_one_or_none()
-
-            if user:
-                # Update mentor status and domains
-                user.is_mentor = True
-                user.expertise_domains = domains
-
-                logger.info(
-                    f"Updated user {user.username or user.telegram_id}: "
-                    f"is_mentor=True, domains={domains}"
-                )
-                updated_count += 1
-            else:
-                logger.warning(
-                    f"User with telegram_id {telegram_id} not found in database. "
-                    f"They need to join the group first."
-                )
-                not_found_count += 1
+
+    updated_count = len(update_params)
+    not_found_count = len(missing)
+
+    # One summary line per outcome instead of a log record per mentor;
+    # %-style args keep formatting lazy when the level is filtered out
+    if update_params:
+        logger.info("Updated %d mentors as is_mentor=True", updated_count)
+        logger.debug("Mentor updates applied: %s", update_params)
+    if missing:
+        logger.warning(
+            "%d configured mentors not found in database (they need to "
+            "join the group first): %s",
+            not_found_count, missing
+        )
 
     # Print summary
     print("\n" + "="*70)
@@ -80,6 +114,7 @@ async def sync_mentors():
     print("="*70)
     print(f"Total mentors in config: {len(mentor_info)}")
     print(f"[+] Successfully updated: {updated_count}")
+    print(f"[=] Already up-to-date: {unchanged_count}")
     print(f"[-] Not found in database: {not_found_count}")
     print("="*70)
 
@@ -88,23 +123,21 @@ async def sync_mentors():
         print("They need to join/interact with the bot first.")
         print("After they join, run this script again.")
 
-    # Show updated mentors
+    # Show updated mentors - everything needed is already in memory from
+    # the sync itself (expire_on_commit=False keeps the loaded objects
+    # readable after the session closes), so no second session or
+    # re-SELECT is needed
     if updated_count > 0:
         print("\n" + "="*70)
         print("UPDATED MENTORS:")
         print("="*70)
-        async with get_db_session() as session:
-            result = await session.execute(
-                select(User).where(User.is_mentor == True)
-            )
-            mentors = result.scalars().all()
-
-            for mentor in mentors:
-                domains_str = ", ".join(mentor.expertise_domains) if mentor.expertise_domains else "None"
-                print(f"\n  Mentor ID: {mentor.telegram_id}")
-                print(f"  Username: @{mentor.username or 'N/A'}")
-                print(f"  Name: {mentor.first_name or 'N/A'}")
-                print(f"  Domains: {domains_str}")
+        for params in update_params:
+            user = found[params["tid"]]
+            domains_str = ", ".join(params["doms"]) if params["doms"] else "None"
+            print(f"\n  Mentor ID: {user.telegram_id}")
+            print(f"  Username: @{user.username or 'N/A'}")
+            print(f"  Name: {user.first_name or 'N/A'}")
+            print(f"  Domains: {domains_str}")
         print("="*70)
 
 